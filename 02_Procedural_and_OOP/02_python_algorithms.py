@@ -152,6 +152,356 @@ def recursive_binary_search(arr, target, left=0, right=None):
 result = recursive_binary_search(sorted_numbers, target)
 print(f"Recursive binary search result: {result}")
 
+print("\n2.4 Batched Binary Search")
+print("-" * 30)
+
+import math
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+def lower_bound(arr, target):
+    """
+    Index of the first element >= target (len(arr) if none)
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    left, right = 0, len(arr)
+    while left < right:
+        mid = (left + right) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def upper_bound(arr, target):
+    """Index of the first element > target (len(arr) if none)"""
+    left, right = 0, len(arr)
+    while left < right:
+        mid = (left + right) // 2
+        if arr[mid] <= target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def count_in_range(arr, low, high):
+    """Number of elements with low <= x <= high in a sorted array"""
+    return max(0, upper_bound(arr, high) - lower_bound(arr, low))
+
+
+def _sweep_sorted_targets(arr, targets, bound):
+    """
+    Merge-style pass over sorted targets: each search resumes where the
+    previous one stopped. Dense queries walk forward linearly in O(n + m);
+    sparse ones bisect the remaining suffix in O(m log n).
+    """
+    n = len(arr)
+    results = []
+    i = 0
+    if len(targets) * max(1, math.log2(n + 1)) < n:
+        bisect_bound = bisect_left if bound == "left" else bisect_right
+        for target in targets:
+            i = bisect_bound(arr, target, i)
+            results.append(i)
+    elif bound == "left":
+        for target in targets:
+            while i < n and arr[i] < target:
+                i += 1
+            results.append(i)
+    else:
+        for target in targets:
+            while i < n and arr[i] <= target:
+                i += 1
+            results.append(i)
+    return results
+
+
+def binary_search_many(arr, targets, side=None, targets_sorted=None, use_numpy=None):
+    """
+    Answer many binary-search queries against one sorted array in a single call
+    side=None returns the index of each target or -1 (like binary_search()),
+    side="left" returns lower bounds and side="right" returns upper bounds.
+    Uses numpy.searchsorted when NumPy is available; otherwise sorted targets
+    get a merge-style sweep and unsorted targets use bisect.
+    Time Complexity: O(m log n), or O(n + m) for dense sorted targets
+    Space Complexity: O(m)
+    """
+    if side not in (None, "left", "right"):
+        raise ValueError("side must be None, 'left' or 'right'")
+    targets = list(targets)
+    bound = side or "left"
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+
+    if use_numpy:
+        np_arr = np.asarray(arr)
+        np_targets = np.asarray(targets)
+        indices = np.searchsorted(np_arr, np_targets, side=bound)
+        if side is None:
+            if len(np_arr) == 0:
+                return [-1] * len(targets)
+            clipped = np.minimum(indices, len(np_arr) - 1)
+            found = (indices < len(np_arr)) & (np_arr[clipped] == np_targets)
+            indices = np.where(found, indices, -1)
+        return indices.tolist()
+
+    if targets_sorted is None:
+        targets_sorted = all(a <= b for a, b in zip(targets, targets[1:]))
+    if targets_sorted:
+        indices = _sweep_sorted_targets(arr, targets, bound)
+    elif bound == "left":
+        indices = [bisect_left(arr, target) for target in targets]
+    else:
+        indices = [bisect_right(arr, target) for target in targets]
+
+    if side is None:
+        n = len(arr)
+        return [
+            i if i < n and arr[i] == target else -1
+            for i, target in zip(indices, targets)
+        ]
+    return indices
+
+
+# Test batched binary search
+queries = [34, 11, 99, 64, 12]
+print(f"Sorted array: {sorted_numbers}")
+print(f"Queries: {queries}")
+print(f"binary_search_many: {binary_search_many(sorted_numbers, queries)}")
+print(f"Lower bounds: {binary_search_many(sorted_numbers, queries, side='left')}")
+print(
+    f"Upper bounds (sorted queries): {binary_search_many(sorted_numbers, sorted(queries), side='right')}"
+)
+print(f"Empty array: {binary_search_many([], queries, use_numpy=False)}")
+if HAS_NUMPY:
+    print(
+        f"Empty array (NumPy) matches: "
+        f"{binary_search_many([], queries, use_numpy=True) == [-1] * len(queries)}"
+    )
+scores = [10, 20, 20, 20, 30, 40, 50]
+print(f"Scores: {scores}")
+print(f"Count of 20..40: {count_in_range(scores, 20, 40)}")
+
+print("\n2.5 Sorted List Container")
+print("-" * 30)
+
+from bisect import insort
+
+
+class SortedList:
+    """
+    Sorted container built from a list of bounded-size sorted blocks
+    Each block holds at most 2 * block_size values and `maxes` keeps the
+    last value of every block, so a search is one bisect over the block
+    maxima plus one bisect inside a block. A Fenwick tree over the block
+    lengths answers rank and index queries.
+    Time Complexity: O(log n + block_size) insert/delete, O(log n) rank
+    Space Complexity: O(n)
+    """
+
+    def __init__(self, iterable=(), block_size=1000):
+        self.block_size = block_size
+        values = sorted(iterable)
+        self._blocks = [
+            values[i : i + block_size] for i in range(0, len(values), block_size)
+        ]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(values)
+        self._build_index()
+
+    # ----- Fenwick tree over block lengths -----
+
+    def _build_index(self):
+        tree = [0] * (len(self._blocks) + 1)
+        for i, block in enumerate(self._blocks, start=1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _index_add(self, block_pos, delta):
+        i = block_pos + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _index_prefix(self, block_pos):
+        """Number of values stored in blocks[:block_pos]"""
+        total = 0
+        i = block_pos
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _index_locate(self, index):
+        """Map a position 0 <= index < len(self) to (block_pos, offset)"""
+        tree = self._tree
+        pos = 0
+        step = 1 << ((len(tree) - 1).bit_length() - 1)
+        while step:
+            candidate = pos + step
+            if candidate < len(tree) and tree[candidate] <= index:
+                pos = candidate
+                index -= tree[candidate]
+            step >>= 1
+        return pos, index
+
+    # ----- Updates -----
+
+    def add(self, value):
+        """Insert `value`, keeping the list sorted"""
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+            self._len = 1
+            self._build_index()
+            return
+
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._blocks[pos].append(value)
+            self._maxes[pos] = value
+        else:
+            insort(self._blocks[pos], value)
+        self._len += 1
+
+        block = self._blocks[pos]
+        if len(block) > 2 * self.block_size:
+            half = len(block) // 2
+            self._blocks[pos : pos + 1] = [block[:half], block[half:]]
+            self._maxes[pos : pos + 1] = [block[half - 1], block[-1]]
+            self._build_index()
+        else:
+            self._index_add(pos, 1)
+
+    def remove(self, value):
+        """Remove one occurrence of `value`; raise ValueError if missing"""
+        pos = bisect_left(self._maxes, value)
+        if pos < len(self._maxes):
+            block = self._blocks[pos]
+            i = bisect_left(block, value)
+            if block[i] == value:
+                self._delete(pos, i)
+                return
+        raise ValueError(f"{value!r} not in SortedList")
+
+    def discard(self, value):
+        """Remove one occurrence of `value` if present"""
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def pop(self, index=-1):
+        """Remove and return the value at `index`"""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        pos, offset = self._index_locate(index)
+        value = self._blocks[pos][offset]
+        self._delete(pos, offset)
+        return value
+
+    def _delete(self, pos, offset):
+        block = self._blocks[pos]
+        del block[offset]
+        self._len -= 1
+        if block:
+            self._maxes[pos] = block[-1]
+            self._index_add(pos, -1)
+        else:
+            del self._blocks[pos]
+            del self._maxes[pos]
+            self._build_index()
+
+    # ----- Queries -----
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        block = self._blocks[pos]
+        return block[bisect_left(block, value)] == value
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        pos, offset = self._index_locate(index)
+        return self._blocks[pos][offset]
+
+    def __repr__(self):
+        return f"SortedList({list(self)})"
+
+    def bisect_left(self, value):
+        """Rank of `value`: number of elements < value"""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._index_prefix(pos) + bisect_left(self._blocks[pos], value)
+
+    def bisect_right(self, value):
+        """Number of elements <= value"""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._index_prefix(pos) + bisect_right(self._blocks[pos], value)
+
+    rank = bisect_left
+
+    def count_range(self, low, high):
+        """Number of elements with low <= x <= high"""
+        return max(0, self.bisect_right(high) - self.bisect_left(low))
+
+    def irange(self, low, high):
+        """Iterate over the elements with low <= x <= high in order"""
+        pos = bisect_left(self._maxes, low)
+        if pos == len(self._maxes):
+            return
+        offset = bisect_left(self._blocks[pos], low)
+        for block in self._blocks[pos:]:
+            for value in block[offset:]:
+                if value > high:
+                    return
+                yield value
+            offset = 0
+
+
+# Test sorted list
+sorted_list = SortedList([64, 34, 25, 12], block_size=2)
+for value in [22, 11, 90, 25]:
+    sorted_list.add(value)
+print(f"SortedList: {sorted_list}")
+print(f"Binary search on its contents: {binary_search(list(sorted_list), 34)}")
+print(f"Rank of 30: {sorted_list.rank(30)}, element at index 3: {sorted_list[3]}")
+print(f"Values in 20..64: {list(sorted_list.irange(20, 64))}")
+print(f"Count in 20..64: {sorted_list.count_range(20, 64)}")
+sorted_list.remove(25)
+print(f"After removing one 25: {sorted_list}, popped max: {sorted_list.pop()}")
+
 # ============================================
 # SECTION 3: SORTING ALGORITHMS
 # ============================================
@@ -310,6 +660,748 @@ print(f"Original array: {unsorted}")
 sorted_arr = quick_sort(unsorted.copy())
 print(f"Quick sorted: {sorted_arr}")
 
+print("\n3.6 Introsort (In-Place Quick Sort)")
+print("-" * 30)
+
+INSERTION_SORT_CUTOFF = 16
+NINTHER_THRESHOLD = 128
+
+
+def _insertion_sort_range(arr, lo, hi):
+    """Insertion sort of arr[lo..hi] (inclusive)"""
+    for i in range(lo + 1, hi + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _sift_down(arr, lo, root, end):
+    """Restore the max-heap property below `root` in the heap arr[lo..lo+end)"""
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            return
+        if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if arr[lo + root] < arr[lo + child]:
+            arr[lo + root], arr[lo + child] = arr[lo + child], arr[lo + root]
+            root = child
+        else:
+            return
+
+
+def _heapsort_range(arr, lo, hi):
+    """In-place heapsort of arr[lo..hi] (inclusive), O(n log n) worst case"""
+    n = hi - lo + 1
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def _median_of_three(arr, a, b, c):
+    """Index of the median of arr[a], arr[b] and arr[c]"""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def _choose_pivot(arr, lo, hi):
+    """Median-of-three for small ranges, Tukey's ninther for large ones"""
+    mid = (lo + hi) // 2
+    if hi - lo + 1 < NINTHER_THRESHOLD:
+        return _median_of_three(arr, lo, mid, hi)
+    step = (hi - lo) // 8
+    return _median_of_three(
+        arr,
+        _median_of_three(arr, lo, lo + step, lo + 2 * step),
+        _median_of_three(arr, mid - step, mid, mid + step),
+        _median_of_three(arr, hi - 2 * step, hi - step, hi),
+    )
+
+
+def _introsort_range(arr, lo, hi, depth_limit):
+    """Sort arr[lo..hi]; recurse on the smaller side and loop on the larger"""
+    while hi - lo + 1 > INSERTION_SORT_CUTOFF:
+        if depth_limit == 0:
+            _heapsort_range(arr, lo, hi)
+            return
+        depth_limit -= 1
+
+        pivot = arr[_choose_pivot(arr, lo, hi)]
+        i, j = lo, hi
+        while i <= j:
+            while arr[i] < pivot:
+                i += 1
+            while arr[j] > pivot:
+                j -= 1
+            if i <= j:
+                arr[i], arr[j] = arr[j], arr[i]
+                i += 1
+                j -= 1
+
+        if j - lo < hi - i:
+            _introsort_range(arr, lo, j, depth_limit)
+            lo = i
+        else:
+            _introsort_range(arr, i, hi, depth_limit)
+            hi = j
+
+    _insertion_sort_range(arr, lo, hi)
+
+
+def introsort(arr, max_depth=None):
+    """
+    Introsort: in-place Quick Sort with median-of-three/ninther pivots,
+    insertion sort for small partitions and a heapsort fallback once the
+    recursion gets deeper than `max_depth` (default 2 * log2(n)).
+    Time Complexity: O(n log n) worst case
+    Space Complexity: O(log n)
+    """
+    if len(arr) > 1:
+        if max_depth is None:
+            max_depth = 2 * len(arr).bit_length()
+        _introsort_range(arr, 0, len(arr) - 1, max_depth)
+    return arr
+
+
+# Test introsort
+unsorted = [64, 34, 25, 12, 22, 11, 90]
+print(f"Original array: {unsorted}")
+sorted_arr = introsort(unsorted.copy())
+print(f"Introsorted: {sorted_arr}")
+large = [(i * 7919) % 1000 for i in range(1000)]
+print(
+    f"Introsort on 1000 items matches sorted(): {introsort(large.copy()) == sorted(large)}"
+)
+print(
+    f"Heapsort fallback (max_depth=0) matches: {introsort(large.copy(), max_depth=0) == sorted(large)}"
+)
+
+print("\n3.7 Counting Sort and Radix Sort")
+print("-" * 30)
+
+from array import array
+
+
+def _int64_range(lo, hi):
+    """True if keys in [lo, hi] (and their span) fit NumPy int64 arithmetic"""
+    return -(2**62) <= lo and hi < 2**62
+
+
+def counting_sort(arr, key=None, use_numpy=None, range_factor=4):
+    """
+    Counting Sort for bounded integers (stable)
+    `key` extracts an integer from each item, so records can be sorted by
+    an integer field. Uses NumPy when available and `use_numpy` is not False.
+    When the key range k is more than `range_factor` times max(n, 256) the
+    count table would dwarf the input, so it falls back to radix_sort.
+    With `key`, the NumPy path is a stable argsort of the keys (a comparison
+    sort in C); only the plain-integer path counts with np.bincount.
+    Time Complexity: O(n + k) where k = max key - min key + 1
+    Space Complexity: O(n + k)
+    """
+    if len(arr) < 2:
+        return list(arr)
+
+    keys = arr if key is None else [key(item) for item in arr]
+    lo, hi = min(keys), max(keys)
+    if hi - lo + 1 > range_factor * max(len(arr), 256):
+        return radix_sort(arr, key=key, use_numpy=use_numpy)
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY and _int64_range(lo, hi)
+
+    if use_numpy:
+        np_keys = np.fromiter(keys, dtype=np.int64, count=len(keys)) - lo
+        if key is None:
+            counts = np.bincount(np_keys, minlength=hi - lo + 1)
+            return np.repeat(np.arange(lo, hi + 1), counts).tolist()
+        order = np.argsort(np_keys, kind="stable")
+        return [arr[i] for i in order.tolist()]
+
+    counts = array("q", [0]) * (hi - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+
+    if key is None:
+        result = []
+        for offset, count in enumerate(counts):
+            if count:
+                result.extend([lo + offset] * count)
+        return result
+
+    # Turn counts into starting positions, then place items in input order
+    position = 0
+    for offset, count in enumerate(counts):
+        counts[offset] = position
+        position += count
+    result = [None] * len(arr)
+    for item, k in zip(arr, keys):
+        result[counts[k - lo]] = item
+        counts[k - lo] += 1
+    return result
+
+
+def _radix_order(keys, max_key, digit_bits):
+    """Stable LSD radix order (array of indices) for non-negative int keys"""
+    n = len(keys)
+    mask = (1 << digit_bits) - 1
+    order = array("q", range(n))
+    shift = 0
+    while max_key >> shift:
+        counts = array("q", [0]) * (mask + 2)
+        for k in keys:
+            counts[((k >> shift) & mask) + 1] += 1
+        for digit in range(mask + 1):
+            counts[digit + 1] += counts[digit]
+
+        next_order = array("q", [0]) * n
+        for i in order:
+            digit = (keys[i] >> shift) & mask
+            next_order[counts[digit]] = i
+            counts[digit] += 1
+        order = next_order
+        shift += digit_bits
+    return order
+
+
+def radix_sort(arr, key=None, digit_bits=8, use_numpy=None):
+    """
+    LSD Radix Sort for integers (stable, negative keys allowed)
+    Processes `digit_bits` bits per pass; the NumPy path sorts each digit
+    column with a stable uint8/uint16 argsort, which NumPy runs as a radix sort.
+    Time Complexity: O(d * (n + 2^digit_bits)) for d digit passes
+    Space Complexity: O(n + 2^digit_bits)
+    """
+    if len(arr) < 2:
+        return list(arr)
+
+    keys = arr if key is None else [key(item) for item in arr]
+    lo, hi = min(keys), max(keys)
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY and _int64_range(lo, hi) and digit_bits <= 16
+
+    if use_numpy:
+        np_keys = np.fromiter(keys, dtype=np.int64, count=len(keys)) - lo
+        digit_type = np.uint8 if digit_bits <= 8 else np.uint16
+        mask = (1 << digit_bits) - 1
+        order = np.arange(len(keys))
+        shift = 0
+        while (hi - lo) >> shift:
+            digits = ((np_keys[order] >> shift) & mask).astype(digit_type)
+            order = order[np.argsort(digits, kind="stable")]
+            shift += digit_bits
+        order = order.tolist()
+    else:
+        order = _radix_order([k - lo for k in keys], hi - lo, digit_bits)
+
+    return [arr[i] for i in order]
+
+
+# Test counting sort and radix sort
+unsorted = [64, 34, 25, 12, 22, 11, 90, -5, 25]
+print(f"NumPy available: {HAS_NUMPY}")
+print(f"Original array: {unsorted}")
+print(f"Counting sorted: {counting_sort(unsorted)}")
+print(f"Radix sorted: {radix_sort(unsorted)}")
+sparse = [10**12, 3, -(10**12), 42]
+print(f"Counting sort on a sparse range (radix fallback): {counting_sort(sparse)}")
+
+events = [
+    ("login", 1700000300),
+    ("logout", 1700000100),
+    ("login", 1700000200),
+    ("error", 1700000100),
+]
+print(f"Events by timestamp (radix): {radix_sort(events, key=lambda event: event[1])}")
+print(
+    f"Events by name length (counting): {counting_sort(events, key=lambda event: len(event[0]))}"
+)
+
+print("\n3.8 External Merge Sort")
+print("-" * 30)
+
+import heapq
+import os
+import random
+import sys
+import tempfile
+
+
+def _merge_in_passes(run_paths, merge_runs, max_fan_in, temp_dir):
+    """Merge groups of runs until at most `max_fan_in` remain open at once"""
+    while len(run_paths) > max_fan_in:
+        merged_paths = []
+        for i in range(0, len(run_paths), max_fan_in):
+            group = run_paths[i : i + max_fan_in]
+            fd, merged_path = tempfile.mkstemp(suffix=".run", dir=temp_dir)
+            os.close(fd)
+            merge_runs(group, merged_path)
+            for path in group:
+                os.remove(path)
+            merged_paths.append(merged_path)
+        run_paths = merged_paths
+    return run_paths
+
+
+def external_sort_lines(
+    input_path,
+    output_path,
+    memory_limit=64 * 1024 * 1024,
+    key=None,
+    encoding="utf-8",
+    max_fan_in=256,
+    temp_dir=None,
+):
+    """
+    External Merge Sort for newline-delimited text records
+    Sorts runs of about `memory_limit` bytes in memory, spills each to a
+    temporary file, then k-way merges the runs with heapq.merge.
+    Records are compared without their line ending, "\n" or "\r\n" (so "a"
+    sorts before "a\tb", as in sorted(), whatever the ending), and `key`
+    receives the stripped record. Lines are written back unchanged.
+    Time Complexity: O(n log n)
+    Space Complexity: O(memory_limit) in memory, O(n) on disk
+    """
+    if key is None:
+        line_key = lambda line: line.rstrip("\r\n")
+    else:
+        line_key = lambda line: key(line.rstrip("\r\n"))
+
+    def write_run(lines):
+        lines.sort(key=line_key)
+        fd, run_path = tempfile.mkstemp(suffix=".run", dir=temp_dir)
+        with open(fd, "w", encoding=encoding, newline="") as run_file:
+            run_file.writelines(lines)
+        return run_path
+
+    def merge_runs(paths, destination):
+        run_files = [open(path, "r", encoding=encoding, newline="") for path in paths]
+        try:
+            with open(destination, "w", encoding=encoding, newline="") as out:
+                out.writelines(heapq.merge(*run_files, key=line_key))
+        finally:
+            for run_file in run_files:
+                run_file.close()
+
+    run_paths = []
+    try:
+        with open(input_path, "r", encoding=encoding, newline="") as source:
+            lines = []
+            used = 0
+            for line in source:
+                if not line.endswith("\n"):
+                    line += "\n"
+                lines.append(line)
+                used += sys.getsizeof(line) + 8
+                if used >= memory_limit:
+                    run_paths.append(write_run(lines))
+                    lines = []
+                    used = 0
+            if lines or not run_paths:
+                run_paths.append(write_run(lines))
+
+        run_paths = _merge_in_passes(run_paths, merge_runs, max_fan_in, temp_dir)
+        merge_runs(run_paths, output_path)
+    finally:
+        for path in run_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _read_int_run(path, typecode, buffer_items):
+    """Yield integers from a binary file one buffered block at a time"""
+    itemsize = array(typecode).itemsize
+    with open(path, "rb") as run_file:
+        while True:
+            block = run_file.read(buffer_items * itemsize)
+            if not block:
+                return
+            values = array(typecode)
+            values.frombytes(block)
+            yield from values
+
+
+def external_sort_ints(
+    input_path,
+    output_path,
+    typecode="q",
+    memory_limit=64 * 1024 * 1024,
+    key=None,
+    max_fan_in=256,
+    temp_dir=None,
+):
+    """
+    External Merge Sort for fixed-width binary integer files
+    `typecode` is an array module code ("i" for int32, "q" for int64, ...)
+    and values are read in native byte order.
+    Time Complexity: O(n log n)
+    Space Complexity: O(memory_limit) in memory, O(n) on disk
+    """
+    itemsize = array(typecode).itemsize
+    # sorted() materializes Python ints, so budget ~40 bytes per value
+    run_items = max(1, memory_limit // (itemsize + 40))
+    buffer_items = max(1, run_items // (max_fan_in + 1))
+
+    def write_run(values):
+        fd, run_path = tempfile.mkstemp(suffix=".run", dir=temp_dir)
+        with open(fd, "wb") as run_file:
+            array(typecode, sorted(values, key=key)).tofile(run_file)
+        return run_path
+
+    def merge_runs(paths, destination):
+        streams = [_read_int_run(path, typecode, buffer_items) for path in paths]
+        with open(destination, "wb") as out:
+            block = array(typecode)
+            for value in heapq.merge(*streams, key=key):
+                block.append(value)
+                if len(block) >= buffer_items:
+                    block.tofile(out)
+                    block = array(typecode)
+            block.tofile(out)
+
+    run_paths = []
+    try:
+        with open(input_path, "rb") as source:
+            while True:
+                chunk = source.read(run_items * itemsize)
+                if not chunk:
+                    break
+                values = array(typecode)
+                values.frombytes(chunk)
+                run_paths.append(write_run(values))
+        if not run_paths:
+            run_paths.append(write_run(array(typecode)))
+
+        run_paths = _merge_in_passes(run_paths, merge_runs, max_fan_in, temp_dir)
+        merge_runs(run_paths, output_path)
+    finally:
+        for path in run_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+# Test external sorts with a tiny memory budget to force several runs
+work_dir = tempfile.mkdtemp()
+records_path = os.path.join(work_dir, "records.txt")
+sorted_records_path = os.path.join(work_dir, "records_sorted.txt")
+with open(records_path, "w", encoding="utf-8") as records_file:
+    for i in range(1000):
+        records_file.write(f"user{random.randint(0, 9999):04d},{i}\n")
+external_sort_lines(records_path, sorted_records_path, memory_limit=4096, max_fan_in=4)
+with open(sorted_records_path, "r", encoding="utf-8") as records_file:
+    sorted_lines = records_file.read().splitlines()
+print(f"External line sort: {len(sorted_lines)} records, first: {sorted_lines[:3]}")
+print(f"Lines in order: {sorted_lines == sorted(sorted_lines)}")
+
+external_sort_lines(
+    records_path,
+    sorted_records_path,
+    memory_limit=4096,
+    key=lambda record: int(record.split(",")[1]),
+)
+with open(sorted_records_path, "r", encoding="utf-8") as records_file:
+    print(f"Sorted by second field: {records_file.read().splitlines()[:3]}")
+
+# Records that are prefixes of others followed by a character below "\n"
+# (mixing "\n" and "\r\n" endings)
+prefix_records = ["a\tb", "a", "", "b", "a\x01", "a"] * 50
+with open(records_path, "w", encoding="utf-8", newline="") as records_file:
+    for i, record in enumerate(prefix_records):
+        records_file.write(record + ("\r\n" if i % 3 == 0 else "\n"))
+external_sort_lines(records_path, sorted_records_path, memory_limit=512, max_fan_in=2)
+with open(sorted_records_path, "r", encoding="utf-8", newline="") as records_file:
+    prefix_sorted = [line.rstrip("\r\n") for line in records_file]
+print(f"Prefix records match sorted(): {prefix_sorted == sorted(prefix_records)}")
+
+ints_path = os.path.join(work_dir, "ints.bin")
+sorted_ints_path = os.path.join(work_dir, "ints_sorted.bin")
+int_values = array("q", (random.randint(-(10**9), 10**9) for _ in range(5000)))
+with open(ints_path, "wb") as ints_file:
+    int_values.tofile(ints_file)
+external_sort_ints(ints_path, sorted_ints_path, memory_limit=16 * 1024)
+sorted_ints = array("q")
+with open(sorted_ints_path, "rb") as ints_file:
+    sorted_ints.frombytes(ints_file.read())
+print(f"External int sort matches sorted(): {list(sorted_ints) == sorted(int_values)}")
+
+for file_name in os.listdir(work_dir):
+    os.remove(os.path.join(work_dir, file_name))
+os.rmdir(work_dir)
+
+print("\n3.9 Parallel Merge Sort")
+print("-" * 30)
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+
+def _pool_context():
+    """Prefer fork so worker processes don't re-run this tutorial on import"""
+    # Forked children inherit unflushed stdout and would print it again
+    sys.stdout.flush()
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _sort_shared_chunk(shm_name, typecode, start, end):
+    """Worker: sort data[start:end] of a shared buffer in place"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        itemsize = array(typecode).itemsize
+        view = shm.buf[start * itemsize : end * itemsize].cast(typecode)
+        view[:] = array(typecode, sorted(view))
+        view.release()
+    finally:
+        shm.close()
+
+
+def _merge_shared_partition(src_name, dst_name, typecode, slices, out_start):
+    """Worker: merge the sorted src slices of one partition into dst[out_start:]"""
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    try:
+        itemsize = array(typecode).itemsize
+        part = array(typecode)
+        for lo, hi in slices:
+            part.frombytes(src.buf[lo * itemsize : hi * itemsize])
+        # Timsort finds the pre-sorted runs and merges them in C
+        merged = array(typecode, sorted(part))
+        out = dst.buf[out_start * itemsize : (out_start + len(part)) * itemsize]
+        out = out.cast(typecode)
+        out[:] = merged
+        out.release()
+    finally:
+        src.close()
+        dst.close()
+
+
+def parallel_merge_sort(data, workers=None, typecode="q"):
+    """
+    Parallel Merge Sort over a process pool
+    The data is copied once into shared memory, so workers only receive
+    buffer names and index ranges instead of pickled lists. Each worker sorts
+    one chunk; then p - 1 splitters picked by regular sampling of the sorted
+    chunks are binary-searched in every chunk, cutting the output into p
+    slices that the workers merge and write in parallel, in one round.
+    Returns an array of the given `typecode` ("q" for ints, "d" for floats).
+    With one worker (or fewer than two items) this is plain sorted().
+    Time Complexity: O(n log n / p) sorting + O(p^2 log n) splitting
+    + O((n / p) log p) merging per worker
+    Space Complexity: O(n) shared memory
+    """
+    values = array(typecode, data)
+    n = len(values)
+    workers = workers or os.cpu_count() or 1
+    if n < 2 or workers == 1:
+        return array(typecode, sorted(values))
+
+    nbytes = n * values.itemsize
+    buffers = [shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(2)]
+    try:
+        buffers[0].buf[:nbytes] = values.tobytes()
+        chunk = -(-n // workers)
+        runs = [(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+        parts = len(runs)
+
+        with ProcessPoolExecutor(workers, mp_context=_pool_context()) as pool:
+            futures = [
+                pool.submit(_sort_shared_chunk, buffers[0].name, typecode, start, end)
+                for start, end in runs
+            ]
+            for future in futures:
+                future.result()
+
+            # Regular sampling: `parts` samples per sorted run, then every
+            # run is cut at the same splitter values, so partition j holds
+            # the values in [splitter j - 1, splitter j) from all runs
+            view = buffers[0].buf[:nbytes].cast(typecode)
+            samples = sorted(
+                view[start + (end - start) * i // parts]
+                for start, end in runs
+                for i in range(parts)
+            )
+            splitters = [samples[j * len(samples) // parts] for j in range(1, parts)]
+            cuts = [
+                [start]
+                + [bisect_left(view, splitter, start, end) for splitter in splitters]
+                + [end]
+                for start, end in runs
+            ]
+            view.release()
+
+            futures = []
+            out_start = 0
+            for j in range(parts):
+                slices = [(bounds[j], bounds[j + 1]) for bounds in cuts]
+                futures.append(
+                    pool.submit(
+                        _merge_shared_partition,
+                        buffers[0].name,
+                        buffers[1].name,
+                        typecode,
+                        slices,
+                        out_start,
+                    )
+                )
+                out_start += sum(hi - lo for lo, hi in slices)
+            for future in futures:
+                future.result()
+
+        result = array(typecode)
+        result.frombytes(buffers[1].buf[:nbytes])
+        return result
+    finally:
+        for shm in buffers:
+            shm.close()
+            shm.unlink()
+
+
+# Test parallel merge sort (worker processes need the main-module guard)
+if __name__ == "__main__":
+    unsorted = [random.randint(-1000, 1000) for _ in range(10_000)]
+    parallel_sorted = parallel_merge_sort(unsorted, workers=4)
+    print(
+        f"Parallel merge sort (4 workers) matches sorted(): "
+        f"{list(parallel_sorted) == sorted(unsorted)}"
+    )
+    print(f"First values: {list(parallel_sorted[:8])}")
+
+print("\n3.10 Selection: Quickselect and Top-k")
+print("-" * 30)
+
+
+def select_kth(arr, k, key=None):
+    """
+    Introselect: the k-th smallest element (0-based) without a full sort
+    Partitions like introsort but only keeps the side containing k, and
+    falls back to heapsort on the remaining range if the depth budget runs out.
+    Time Complexity: O(n) average, O(n log n) worst case
+    Space Complexity: O(n) for the working copy
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError("k out of range")
+
+    # Decorating with the index keeps ties stable and never compares items
+    work = list(arr) if key is None else [(key(item), i) for i, item in enumerate(arr)]
+    lo, hi = 0, n - 1
+    depth_limit = 2 * n.bit_length()
+
+    while hi - lo + 1 > INSERTION_SORT_CUTOFF:
+        if depth_limit == 0:
+            _heapsort_range(work, lo, hi)
+            break
+        depth_limit -= 1
+
+        pivot = work[_choose_pivot(work, lo, hi)]
+        i, j = lo, hi
+        while i <= j:
+            while work[i] < pivot:
+                i += 1
+            while work[j] > pivot:
+                j -= 1
+            if i <= j:
+                work[i], work[j] = work[j], work[i]
+                i += 1
+                j -= 1
+
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break  # work[j + 1 : i] all equal the pivot
+    else:
+        _insertion_sort_range(work, lo, hi)
+
+    return work[k] if key is None else arr[work[k][1]]
+
+
+class _Descending:
+    """Reverses the ordering of a key so a min-heap behaves like a max-heap"""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def top_k(iterable, k, key=None, largest=True):
+    """
+    Streaming Top-k with a bounded heap
+    Consumes any iterable in one pass, keeping only the k best entries, and
+    returns them best-first. Ties keep their input order.
+    Time Complexity: O(n log k)
+    Space Complexity: O(k)
+    """
+    if k <= 0:
+        return []
+
+    iterator = iter(iterable)
+    heap = []
+    for order, item in zip(range(k), iterator):
+        item_key = item if key is None else key(item)
+        heap.append((item_key if largest else _Descending(item_key), -order, item))
+    heapq.heapify(heap)
+
+    # The heap root is the worst entry kept; most items lose to it and are
+    # rejected by a single key comparison before any tuple is built
+    if len(heap) == k:
+        worst = heap[0][0] if largest else heap[0][0].key
+        for order, item in enumerate(iterator, start=k):
+            item_key = item if key is None else key(item)
+            if largest:
+                if not worst < item_key:
+                    continue
+                heapq.heapreplace(heap, (item_key, -order, item))
+                worst = heap[0][0]
+            else:
+                if not item_key < worst:
+                    continue
+                heapq.heapreplace(heap, (_Descending(item_key), -order, item))
+                worst = heap[0][0].key
+
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap]
+
+
+def nsmallest(iterable, k, key=None):
+    """The k smallest items in ascending order (streaming, O(k) memory)"""
+    return top_k(iterable, k, key=key, largest=False)
+
+
+def nlargest(iterable, k, key=None):
+    """The k largest items in descending order (streaming, O(k) memory)"""
+    return top_k(iterable, k, key=key, largest=True)
+
+
+# Test selection
+unsorted = [64, 34, 25, 12, 22, 11, 90]
+print(f"Original array: {unsorted}")
+print(f"Median (k=3): {select_kth(unsorted, len(unsorted) // 2)}")
+print(f"Smallest 3: {nsmallest(unsorted, 3)}")
+print(f"Largest 3: {nlargest(iter(unsorted), 3)}")
+products = [("pen", 1.5), ("book", 12.0), ("lamp", 30.0), ("mug", 8.0)]
+print(f"Cheapest 2: {nsmallest(products, 2, key=lambda product: product[1])}")
+print(f"Second cheapest: {select_kth(products, 1, key=lambda product: product[1])}")
+
 # ============================================
 # SECTION 4: RECURSIVE ALGORITHMS
 # ============================================
@@ -351,24 +1443,125 @@ def fibonacci(n):
     return fibonacci(n - 1) + fibonacci(n - 2)
 
 
-def fibonacci_memo(n, memo={}):
+from collections import OrderedDict
+
+
+class BoundedCache:
     """
-    Memoized Fibonacci (Dynamic Programming)
-    Time Complexity: O(n)
-    Space Complexity: O(n)
+    Least-recently-used cache with a fixed number of entries
+    Replaces an ever-growing memo dict: once `max_size` entries are stored
+    the least recently used one is evicted. Tracks hits and misses.
     """
-    if n in memo:
-        return memo[n]
-    if n <= 1:
-        return n
-    memo[n] = fibonacci_memo(n - 1, memo) + fibonacci_memo(n - 2, memo)
-    return memo[n]
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._data),
+            "max_size": self.max_size,
+        }
+
+
+def _fibonacci_pair(n):
+    """
+    Fast doubling: (F(n), F(n + 1)) from the identities
+    F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)² + F(k+1)²
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci_fast(n):
+    """
+    Fast-Doubling Fibonacci
+    Time Complexity: O(log n) big-integer multiplications
+    Space Complexity: O(1) besides the result
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return _fibonacci_pair(n)[0]
+
+
+def fibonacci_range(start, stop):
+    """
+    F(start), F(start + 1), ..., F(stop) in one pass
+    Time Complexity: O(log start + (stop - start)) big-integer operations
+    """
+    if start < 0 or stop < start:
+        raise ValueError("need 0 <= start <= stop")
+    a, b = _fibonacci_pair(start)
+    result = []
+    for _ in range(stop - start + 1):
+        result.append(a)
+        a, b = b, a + b
+    return result
+
+
+fibonacci_cache = BoundedCache(max_size=1000)
+
+
+def fibonacci_memo(n, cache=None):
+    """
+    Memoized Fibonacci backed by a bounded LRU cache
+    Misses are computed with fast doubling, so there is no recursion depth
+    limit and memory stays within the cache's max_size.
+    Time Complexity: O(1) on a hit, O(log n) on a miss
+    Space Complexity: O(max_size)
+    """
+    if cache is None:
+        cache = fibonacci_cache
+    value = cache.get(n)
+    if value is None:
+        value = fibonacci_fast(n)
+        cache.put(n, value)
+    return value
 
 
 # Test fibonacci
 n = 10
 print(f"Fibonacci({n}) = {fibonacci(n)}")
 print(f"Memoized Fibonacci({n}) = {fibonacci_memo(n)}")
+print(f"Memoized Fibonacci({n}) again = {fibonacci_memo(n)}")
+print(f"Cache stats: {fibonacci_cache.stats()}")
+print(f"Fast doubling Fibonacci(100) = {fibonacci_fast(100)}")
+print(f"Fibonacci(10_000) has {len(str(fibonacci_memo(10_000)))} digits")
+print(f"Fibonacci(10..20) = {fibonacci_range(10, 20)}")
 
 print("\n4.3 Tower of Hanoi")
 print("-" * 30)
@@ -444,6 +1637,356 @@ print("\nPostorder:", end=" ")
 postorder_traversal(root)
 print()
 
+print("\n4.5 Compact Tree Layouts")
+print("-" * 30)
+
+
+class SlotsTreeNode:
+    """TreeNode with __slots__: no per-instance __dict__, same attributes"""
+
+    __slots__ = ("val", "left", "right")
+
+    def __init__(self, val=0):
+        self.val = val
+        self.left = None
+        self.right = None
+
+
+class ArrayTree:
+    """
+    Binary tree stored as a structure of arrays
+    Node i has value vals[i] and children left[i]/right[i], with -1 for a
+    missing child; `root` is the index of the root (-1 when empty). Three
+    flat columns replace one Python object per node, and iter_preorder(),
+    iter_inorder() and iter_postorder() (4.6) accept an ArrayTree directly.
+    Space Complexity: O(n) - itemsize(vals) + 8 bytes per node
+    """
+
+    def __init__(self, typecode="q"):
+        self.vals = array(typecode)
+        self.left = array("i")
+        self.right = array("i")
+        self.root = -1
+
+    @classmethod
+    def from_nodes(cls, root, typecode="q"):
+        """Copy a linked tree (TreeNode or SlotsTreeNode) without recursion"""
+        tree = cls(typecode)
+        if root is None:
+            return tree
+        tree.root = tree.add_node(root.val)
+        stack = [(root, tree.root)]
+        while stack:
+            node, index = stack.pop()
+            if node.left:
+                tree.left[index] = tree.add_node(node.left.val)
+                stack.append((node.left, tree.left[index]))
+            if node.right:
+                tree.right[index] = tree.add_node(node.right.val)
+                stack.append((node.right, tree.right[index]))
+        return tree
+
+    def add_node(self, val, left=-1, right=-1):
+        """Append a node and return its index (the first node becomes the root)"""
+        index = len(self.vals)
+        self.vals.append(val)
+        self.left.append(left)
+        self.right.append(right)
+        if self.root == -1:
+            self.root = index
+        return index
+
+    def __len__(self):
+        return len(self.vals)
+
+    def memory_bytes(self):
+        """Bytes used by the three columns"""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.vals, self.left, self.right)
+        )
+
+    def preorder(self, visitor=None):
+        """Preorder traversal over indices (Root -> Left -> Right)"""
+        vals, left, right = self.vals, self.left, self.right
+        stack = [self.root] if self.root >= 0 else []
+        while stack:
+            index = stack.pop()
+            if visitor:
+                visitor(vals[index])
+            yield vals[index]
+            if right[index] >= 0:
+                stack.append(right[index])
+            if left[index] >= 0:
+                stack.append(left[index])
+
+    def inorder(self, visitor=None):
+        """Inorder traversal over indices (Left -> Root -> Right)"""
+        vals, left, right = self.vals, self.left, self.right
+        stack = []
+        index = self.root
+        while stack or index >= 0:
+            while index >= 0:
+                stack.append(index)
+                index = left[index]
+            index = stack.pop()
+            if visitor:
+                visitor(vals[index])
+            yield vals[index]
+            index = right[index]
+
+    def postorder(self, visitor=None):
+        """Postorder traversal over indices (Left -> Right -> Root)"""
+        vals, left, right = self.vals, self.left, self.right
+        stack = []
+        index = self.root
+        last_visited = -1
+        while stack or index >= 0:
+            while index >= 0:
+                stack.append(index)
+                index = left[index]
+            top = stack[-1]
+            if right[top] >= 0 and right[top] != last_visited:
+                index = right[top]
+            else:
+                stack.pop()
+                if visitor:
+                    visitor(vals[top])
+                yield vals[top]
+                last_visited = top
+
+
+# Test the compact layouts
+array_tree = ArrayTree.from_nodes(root)
+print(f"ArrayTree inorder: {list(array_tree.inorder())}")
+print(
+    f"ArrayTree columns: {array_tree.memory_bytes()} bytes for {len(array_tree)} nodes"
+)
+
+print("\n4.6 Iterative Tree Traversals")
+print("-" * 30)
+
+
+def iter_preorder(root, visitor=None):
+    """
+    Preorder traversal with an explicit stack (Root -> Left -> Right)
+    Yields node values instead of printing; `visitor` is called on each value.
+    Works on TreeNode/SlotsTreeNode trees and on an ArrayTree (see 4.5).
+    Time Complexity: O(n)
+    Space Complexity: O(h) - no recursion limit on deep trees
+    """
+    if isinstance(root, ArrayTree):
+        yield from root.preorder(visitor)
+        return
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        if visitor:
+            visitor(node.val)
+        yield node.val
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def iter_inorder(root, visitor=None):
+    """Inorder traversal with an explicit stack (Left -> Root -> Right)"""
+    if isinstance(root, ArrayTree):
+        yield from root.inorder(visitor)
+        return
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        if visitor:
+            visitor(node.val)
+        yield node.val
+        node = node.right
+
+
+def iter_postorder(root, visitor=None):
+    """Postorder traversal with an explicit stack (Left -> Right -> Root)"""
+    if isinstance(root, ArrayTree):
+        yield from root.postorder(visitor)
+        return
+    stack = []
+    node = root
+    last_visited = None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        # Descend right only if the right subtree hasn't been finished yet
+        if top.right and top.right is not last_visited:
+            node = top.right
+        else:
+            stack.pop()
+            if visitor:
+                visitor(top.val)
+            yield top.val
+            last_visited = top
+
+
+# Test iterative traversals on the same tree
+print(f"Iterative inorder: {list(iter_inorder(root))}")
+print(f"Iterative preorder: {list(iter_preorder(root))}")
+print(f"Iterative postorder: {list(iter_postorder(root))}")
+visited_values = []
+for _ in iter_inorder(root, visitor=visited_values.append):
+    pass
+print(f"Visitor collected: {visited_values}")
+
+slots_root = SlotsTreeNode(1)
+slots_root.left = SlotsTreeNode(2)
+slots_root.right = SlotsTreeNode(3)
+slots_root.left.left = SlotsTreeNode(4)
+slots_root.left.right = SlotsTreeNode(5)
+print(f"__slots__ tree inorder: {list(iter_inorder(slots_root))}")
+print(f"ArrayTree preorder: {list(iter_preorder(array_tree))}")
+print(f"ArrayTree postorder: {list(iter_postorder(array_tree))}")
+
+print("\n4.7 Tower of Hanoi Move Generator")
+print("-" * 30)
+
+HANOI_PEGS = 3
+
+
+def _hanoi_peg(n, disk, moves_done):
+    """Peg index (0 source, 1 auxiliary, 2 target) of `disk` after `moves_done` moves"""
+    # Disk d moves every 2^d moves, first at move 2^(d-1), always cycling the
+    # same way: the largest disk goes 0 -> 2, the next 0 -> 1 -> 2, and so on
+    step = -1 if (n - disk) % 2 == 0 else 1
+    times_moved = (moves_done + (1 << (disk - 1))) >> disk
+    return (times_moved * step) % HANOI_PEGS
+
+
+def _hanoi_move_ids(n, k):
+    """(disk, from_peg, to_peg) of move k (0-based) as peg indexes"""
+    disk = ((k + 1) & -(k + 1)).bit_length()
+    from_peg = _hanoi_peg(n, disk, k)
+    step = -1 if (n - disk) % 2 == 0 else 1
+    return disk, from_peg, (from_peg + step) % HANOI_PEGS
+
+
+def move_at(n, k, source="A", auxiliary="B", target="C"):
+    """
+    The k-th move (0-based) of the optimal n-disk solution, computed directly
+    Move k moves disk (number of trailing zero bits of k + 1) + 1, and every
+    disk cycles through the pegs in a fixed direction, so its position is
+    known from how often it has moved.
+    Time Complexity: O(1) arithmetic on n-bit integers
+    Space Complexity: O(1)
+    """
+    if not 0 <= k < (1 << n) - 1:
+        raise IndexError(f"move {k} out of range for {n} disks")
+    pegs = (source, auxiliary, target)
+    disk, from_peg, to_peg = _hanoi_move_ids(n, k)
+    return disk, pegs[from_peg], pegs[to_peg]
+
+
+def hanoi_moves(n, source="A", auxiliary="B", target="C"):
+    """
+    Tower of Hanoi as a generator of (disk, from, to) moves
+    Iterative binary-counter formulation: nothing is printed and no
+    recursion or move list is kept.
+    Time Complexity: O(2ⁿ)
+    Space Complexity: O(1)
+    """
+    pegs = (source, auxiliary, target)
+    for k in range((1 << n) - 1):
+        disk, from_peg, to_peg = _hanoi_move_ids(n, k)
+        yield disk, pegs[from_peg], pegs[to_peg]
+
+
+def _pack_move(disk, from_peg, to_peg):
+    # 5 bits of disk - 1, then 3 bits for the 6 possible (from, to) pairs
+    return (disk - 1) << 3 | from_peg * 2 + (to_peg - from_peg) % 3 - 1
+
+
+def _relabel_table(mapping):
+    """bytes.translate table that renames pegs in packed moves"""
+    table = bytearray(range(256))
+    for byte in range(256):
+        code = byte & 7
+        if code < 6:
+            from_peg = code >> 1
+            to_peg = (from_peg + 1 + (code & 1)) % 3
+            table[byte] = _pack_move(
+                (byte >> 3) + 1, mapping[from_peg], mapping[to_peg]
+            )
+    return bytes(table)
+
+
+def pack_hanoi_moves(n, chunk_disks=20):
+    """
+    Packed export: one byte per move, yielded in chunks of 2^chunk_disks moves
+    Each byte holds (disk - 1) << 3 plus a 3-bit code for the pegs, decoded
+    by unpack_hanoi_moves(). The solution for m disks is the m - 1 solution
+    with two pegs renamed, the largest disk's move, and the m - 1 solution
+    with two other pegs renamed; renaming is a bytes.translate, so chunks
+    are built at C speed and larger puzzles are streamed chunk by chunk.
+    Supports up to 32 disks (over 4 billion moves).
+    Time Complexity: O(2ⁿ)
+    Space Complexity: O(2^chunk_disks)
+    """
+    if not 1 <= n <= 32:
+        raise ValueError("packed moves support 1 to 32 disks")
+    m = min(n, chunk_disks)
+    block = b""
+    swap_target = _relabel_table((0, 2, 1))
+    swap_source = _relabel_table((1, 0, 2))
+    for disk in range(1, m + 1):
+        block = (
+            block.translate(swap_target)
+            + bytes([_pack_move(disk, 0, 2)])
+            + block.translate(swap_source)
+        )
+    if m == n:
+        yield block
+        return
+
+    # Between the 2^(n - m) copies of the m-disk block come single moves of
+    # the larger disks; each copy moves the small tower between the pegs
+    # where disk m is before and after its one move in that block
+    tables = {}
+    block_size = 1 << m
+    for i in range(1 << (n - m)):
+        first = i * block_size
+        from_peg = _hanoi_peg(n, m, first)
+        to_peg = _hanoi_peg(n, m, first + block_size - 1)
+        mapping = (from_peg, 3 - from_peg - to_peg, to_peg)
+        if mapping not in tables:
+            tables[mapping] = _relabel_table(mapping)
+        chunk = block.translate(tables[mapping])
+        if first + block_size - 1 < (1 << n) - 1:
+            chunk += bytes([_pack_move(*_hanoi_move_ids(n, first + block_size - 1))])
+        yield chunk
+
+
+def unpack_hanoi_moves(data, source="A", auxiliary="B", target="C"):
+    """Decode packed moves back into (disk, from, to) tuples"""
+    pegs = (source, auxiliary, target)
+    for byte in data:
+        from_peg = (byte & 7) >> 1
+        to_peg = (from_peg + 1 + (byte & 1)) % 3
+        yield (byte >> 3) + 1, pegs[from_peg], pegs[to_peg]
+
+
+# Test the move generator against the recursive version's order
+print(f"Moves for 3 disks: {list(hanoi_moves(3))}")
+print(f"Move at index 3 for 3 disks: {move_at(3, 3)}")
+print(f"Move 2^39 of 40 disks (largest disk): {move_at(40, (1 << 39) - 1)}")
+packed = b"".join(pack_hanoi_moves(10, chunk_disks=4))
+print(
+    f"Packed 10 disks: {len(packed)} bytes, "
+    f"matches generator: {list(unpack_hanoi_moves(packed)) == list(hanoi_moves(10))}"
+)
+
 # ============================================
 # SECTION 5: DYNAMIC PROGRAMMING
 # ============================================
@@ -545,12 +2088,468 @@ print(f"Coins: {coins}")
 print(f"Amount: {amount}")
 print(f"Minimum coins needed: {result}")
 
-# ============================================
-# SECTION 6: GREEDY ALGORITHMS
-# ============================================
-print("\n" + "=" * 60)
-print("SECTION 6: GREEDY ALGORITHMS")
-print("=" * 60)
+print("\n5.4 Reusable Memoization Layer")
+print("-" * 30)
+
+# cache_utils lives with the other utility modules of the packages chapter
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "03_Packages_Modules_Libraries_Tools",
+        "Examples",
+    )
+)
+
+try:
+    from cache_utils import cache_report, memoize
+
+    # Any DP function can opt in by wrapping it; arguments must be hashable
+    cached_lcs = memoize(max_size=256)(longest_common_subsequence)
+    cached_coin_change = memoize(max_size=256, ttl=3600)(coin_change)
+
+    for _ in range(3):
+        cached_lcs("ABCDGH", "AEDFHR")
+        cached_coin_change((1, 2, 5), 11)
+    print(f"Cached LCS: {cached_lcs('ABCDGH', 'AEDFHR')}")
+    print(f"Cached coin change: {cached_coin_change((1, 2, 5), 11)}")
+    for name, stats in cache_report().items():
+        print(f"{name}: {stats['hits']} hits, {stats['misses']} misses")
+except ImportError:
+    print("cache_utils is not available")
+
+print("\n5.5 Linear-Space and Bit-Parallel LCS")
+print("-" * 30)
+
+
+def _lcs_last_row(text1, text2):
+    """Last row of the LCS length table for text1 vs text2 in O(len(text2)) space"""
+    previous = [0] * (len(text2) + 1)
+    for char in text1:
+        current = [0]
+        for j, other in enumerate(text2, start=1):
+            if char == other:
+                current.append(previous[j - 1] + 1)
+            else:
+                left = current[j - 1]
+                up = previous[j]
+                current.append(left if left > up else up)
+        previous = current
+    return previous
+
+
+def lcs_hirschberg(text1, text2):
+    """
+    Hirschberg's Longest Common Subsequence (returns the subsequence itself)
+    Splits text1 in half, finds where the optimal path crosses the middle
+    row using one forward and one backward pass of last-row DP, then solves
+    both halves recursively.
+    Time Complexity: O(m * n)
+    Space Complexity: O(m + n)
+    """
+    if not text1 or not text2:
+        return text1[:0]
+    if len(text1) == 1:
+        return text1 if text1[0] in text2 else text1[:0]
+
+    mid = len(text1) // 2
+    forward = _lcs_last_row(text1[:mid], text2)
+    backward = _lcs_last_row(text1[mid:][::-1], text2[::-1])
+
+    n = len(text2)
+    split = max(range(n + 1), key=lambda k: forward[k] + backward[n - k])
+    return lcs_hirschberg(text1[:mid], text2[:split]) + lcs_hirschberg(
+        text1[mid:], text2[split:]
+    )
+
+
+def lcs_length_bitparallel(text1, text2):
+    """
+    Bit-parallel LCS length (Allison-Dix / Hyyrö) using Python ints as bit vectors
+    Bit j of `row` is 0 where the LCS length grows at column j, so each
+    character of text1 updates a whole DP row with a few big-integer operations.
+    Time Complexity: O(m * n / w) for machine word size w
+    Space Complexity: O(n + alphabet size * n / w)
+    """
+    match_masks = {}
+    for j, char in enumerate(text2):
+        match_masks[char] = match_masks.get(char, 0) | (1 << j)
+
+    mask = (1 << len(text2)) - 1
+    row = mask
+    for char in text1:
+        matches = row & match_masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & mask
+    return len(text2) - bin(row).count("1")
+
+
+# Test linear-space LCS
+text1 = "ABCDGH"
+text2 = "AEDFHR"
+print(f"Text1: {text1}")
+print(f"Text2: {text2}")
+print(f"Hirschberg LCS: {lcs_hirschberg(text1, text2)!r}")
+print(f"Bit-parallel LCS length: {lcs_length_bitparallel(text1, text2)}")
+old_config = ["host=a", "port=80", "debug=false", "workers=4"]
+new_config = ["host=a", "port=8080", "debug=false", "workers=4", "tls=on"]
+print(f"Unchanged config lines: {lcs_hirschberg(old_config, new_config)}")
+
+print("\n5.6 Rolling-Array and Vectorized Knapsack")
+print("-" * 30)
+
+
+def _knapsack_rolling(weights, values, capacity, decisions):
+    """One DP row updated right-to-left so each item is used at most once"""
+    dp = array("q", [0]) * (capacity + 1)
+    row_bits = capacity + 1
+    for i, (weight, value) in enumerate(zip(weights, values)):
+        base = i * row_bits
+        for w in range(capacity, weight - 1, -1):
+            candidate = dp[w - weight] + value
+            if candidate > dp[w]:
+                dp[w] = candidate
+                if decisions is not None:
+                    bit = base + w
+                    decisions[bit >> 3] |= 1 << (bit & 7)
+    return dp[capacity]
+
+
+def _knapsack_numpy(weights, values, capacity, decisions):
+    """Each item is one np.maximum over a shifted view of the DP row"""
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    for weight, value in zip(weights, values):
+        if weight > capacity:
+            if decisions is not None:
+                decisions.append(None)
+            continue
+        candidate = dp[: capacity + 1 - weight] + value
+        if decisions is not None:
+            decisions.append(np.packbits(candidate > dp[weight:]))
+        np.maximum(dp[weight:], candidate, out=dp[weight:])
+    return int(dp[capacity])
+
+
+def knapsack_optimized(weights, values, capacity, use_numpy=None, return_items=False):
+    """
+    0/1 Knapsack with a single rolling DP row
+    The NumPy mode replaces the inner capacity loop with vectorized row
+    updates. With return_items=True one decision bit per (item, capacity)
+    is kept in a packed bitset - n * (W + 1) / 8 bytes instead of an
+    n * W table of Python ints - and the chosen items are recovered by
+    walking the bits backwards.
+    Time Complexity: O(n * W)
+    Space Complexity: O(W), plus O(n * W / 8) bytes with return_items
+    Returns the best value, or (best value, chosen item indices).
+    """
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    n = len(weights)
+
+    if use_numpy:
+        decisions = [] if return_items else None
+        best = _knapsack_numpy(weights, values, capacity, decisions)
+    else:
+        decisions = bytearray((n * (capacity + 1) + 7) // 8) if return_items else None
+        best = _knapsack_rolling(weights, values, capacity, decisions)
+
+    if not return_items:
+        return best
+
+    chosen = []
+    w = capacity
+    for i in range(n - 1, -1, -1):
+        if use_numpy:
+            packed = decisions[i]
+            offset = w - weights[i]
+            taken = (
+                packed is not None
+                and offset >= 0
+                and (packed[offset >> 3] >> (7 - (offset & 7))) & 1
+            )
+        else:
+            bit = i * (capacity + 1) + w
+            taken = (decisions[bit >> 3] >> (bit & 7)) & 1
+        if taken:
+            chosen.append(i)
+            w -= weights[i]
+    chosen.reverse()
+    return best, chosen
+
+
+# Test optimized knapsack
+weights = [2, 3, 4, 5]
+values = [3, 4, 5, 6]
+capacity = 10
+print(
+    f"Rolling-array knapsack: {knapsack_optimized(weights, values, capacity, use_numpy=False)}"
+)
+best, chosen = knapsack_optimized(weights, values, capacity, return_items=True)
+print(f"Best value {best} using items {chosen}")
+print(
+    f"Chosen weights: {[weights[i] for i in chosen]}, values: {[values[i] for i in chosen]}"
+)
+
+print("\n5.7 Multi-Query Coin Change Solver")
+print("-" * 30)
+
+
+class CoinChangeSolver:
+    """
+    Coin Change for one coin set and many amounts
+    The minimum-coins table is built once and grown lazily whenever a larger
+    amount is asked for, so repeated queries are O(1) lookups. Tables are
+    compact array('I') columns: the minimum coin count and the last coin
+    used for each amount, which is enough to reconstruct a solution.
+    Time Complexity: O(A * k) to build up to amount A with k coins, O(1) per query
+    Space Complexity: O(A) for min_coins, O(A * k) once count_ways() is used
+    """
+
+    def __init__(self, coins, max_amount=0):
+        self.coins = sorted(set(coins))
+        if not self.coins or self.coins[0] <= 0:
+            raise ValueError("coins must be positive integers")
+        self.unreachable = (1 << (8 * array("I").itemsize)) - 1
+        self._min_coins = array("I", [0])
+        self._last_coin = array("I", [0])
+        self._ways = None
+        self._extend(max_amount)
+
+    def _extend(self, amount):
+        """Grow the min-coins table so it covers `amount`"""
+        min_coins = self._min_coins
+        last_coin = self._last_coin
+        unreachable = self.unreachable
+        for i in range(len(min_coins), amount + 1):
+            best = unreachable
+            best_coin = 0
+            for coin in self.coins:
+                if coin > i:
+                    break
+                previous = min_coins[i - coin]
+                if previous != unreachable and previous + 1 < best:
+                    best = previous + 1
+                    best_coin = coin
+            min_coins.append(best)
+            last_coin.append(best_coin)
+
+    def min_coins(self, amount):
+        """Minimum number of coins for `amount`, or -1 if it can't be made"""
+        if amount < 0:
+            return -1
+        if amount >= len(self._min_coins):
+            self._extend(amount)
+        count = self._min_coins[amount]
+        return -1 if count == self.unreachable else count
+
+    def coins_used(self, amount):
+        """One optimal list of coins for `amount`, or None if it can't be made"""
+        if self.min_coins(amount) == -1:
+            return None
+        used = []
+        while amount > 0:
+            coin = self._last_coin[amount]
+            used.append(coin)
+            amount -= coin
+        return used
+
+    def count_ways(self, amount):
+        """
+        Number of coin combinations (order ignored) that make `amount`
+        One row per coin: ways[k][i] = ways[k - 1][i] + ways[k][i - coin_k],
+        which can also be extended one amount at a time.
+        """
+        if amount < 0:
+            return 0
+        if self._ways is None:
+            self._ways = [[1] for _ in self.coins]
+        rows = self._ways
+        for i in range(len(rows[0]), amount + 1):
+            below = 0
+            for coin, row in zip(self.coins, rows):
+                below += row[i - coin] if coin <= i else 0
+                row.append(below)
+        return rows[-1][amount]
+
+
+# Test coin change solver
+solver = CoinChangeSolver([1, 2, 5])
+for amount in [11, 3, 27, 0]:
+    print(
+        f"Amount {amount}: {solver.min_coins(amount)} coins {solver.coins_used(amount)}, "
+        f"{solver.count_ways(amount)} ways"
+    )
+odd_solver = CoinChangeSolver([4, 6])
+print(f"Coins [4, 6], amount 7: {odd_solver.min_coins(7)} {odd_solver.coins_used(7)}")
+print(f"Table size after queries: {len(solver._min_coins)} amounts")
+
+print("\n5.8 Edit Distance with a Band Cutoff")
+print("-" * 30)
+
+
+def _strip_common_affixes(a, b):
+    """Drop the shared prefix and suffix, which never change an edit distance"""
+    start = 0
+    limit = min(len(a), len(b))
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    return a[start:end_a], b[start:end_b]
+
+
+def _banded_edit_distance(a, b, max_distance, transpositions):
+    """Shared DP for levenshtein() and damerau_levenshtein()"""
+    a, b = _strip_common_affixes(a, b)
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    k = n if max_distance is None else max_distance
+    cap = k + 1
+    if n - m > k:
+        return cap
+    if m == 0:
+        return n
+
+    # Values are capped at k + 1, so cells outside the band can hold the cap.
+    # Three rows are rotated; cells never written keep their initial cap.
+    before_previous = [cap] * (m + 1)
+    previous = [min(j, cap) for j in range(m + 1)]
+    current = [cap] * (m + 1)
+    for i in range(1, n + 1):
+        lo = max(1, i - k)
+        hi = min(m, i + k)
+        current[lo - 1] = min(i, cap) if lo == 1 else cap
+        char = a[i - 1]
+        for j in range(lo, hi + 1):
+            value = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                transpositions
+                and i > 1
+                and j > 1
+                and char == b[j - 2]
+                and a[i - 2] == b[j - 1]
+                and before_previous[j - 2] + 1 < value
+            ):
+                value = before_previous[j - 2] + 1
+            current[j] = value if value < cap else cap
+        # Every alignment passes through this row, so stop once all of it is over k
+        if min(current[lo - 1 : hi + 1]) > k:
+            return cap
+        before_previous, previous, current = previous, current, before_previous
+    return previous[m]
+
+
+def levenshtein(a, b, max_distance=None):
+    """
+    Levenshtein Distance (insertions, deletions, substitutions)
+    With max_distance=k only the diagonal band |i - j| <= k is filled
+    (Ukkonen's cutoff) and the DP stops as soon as a whole row exceeds k.
+    Returns the distance, or k + 1 for any distance above k.
+    Time Complexity: O(k * min(m, n)) with a cutoff, O(m * n) without
+    Space Complexity: O(min(m, n))
+    """
+    return _banded_edit_distance(a, b, max_distance, transpositions=False)
+
+
+def damerau_levenshtein(a, b, max_distance=None):
+    """
+    Damerau-Levenshtein Distance (optimal string alignment variant)
+    Like levenshtein() but swapping two adjacent characters costs one edit;
+    a substring is not edited again after being transposed.
+    Time Complexity: O(k * min(m, n)) with a cutoff, O(m * n) without
+    Space Complexity: O(min(m, n))
+    """
+    return _banded_edit_distance(a, b, max_distance, transpositions=True)
+
+
+def _qgram_counts(text, q):
+    counts = {}
+    for i in range(len(text) - q + 1):
+        gram = text[i : i + q]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+# Whether each known distance counts a transposition as one edit
+_TRANSPOSITIONS = {levenshtein: False, damerau_levenshtein: True}
+
+
+def best_matches(
+    query, candidates, k, q=2, distance=levenshtein, limit=None, transpositions=None
+):
+    """
+    Fuzzy matching of one query against many candidates
+    Candidates are streamed through two cheap filters before the banded DP:
+    lengths must differ by at most k, and by the q-gram lemma a string
+    within k edits shares at least max(len) - q + 1 - k * q q-grams with
+    the query (k * (q + 1) with `transpositions`, since one transposition
+    can break q + 1 q-grams). `transpositions=None` looks `distance` up in
+    the known functions and assumes True for any other (wrapped, partial)
+    distance, which keeps the filter safe.
+    Returns up to `limit` (distance, candidate) pairs with distance <= k,
+    closest first.
+    Time Complexity: O(N * L) filtering + O(k * L) per surviving candidate
+    Space Complexity: O(L + matches)
+    """
+    query_counts = _qgram_counts(query, q)
+    if transpositions is None:
+        transpositions = _TRANSPOSITIONS.get(distance, True)
+    grams_per_edit = q + 1 if transpositions else q
+    query_length = len(query)
+    matches = []
+    for candidate in candidates:
+        if abs(len(candidate) - query_length) > k:
+            continue
+        needed = max(len(candidate), query_length) - q + 1 - k * grams_per_edit
+        if needed > 0:
+            remaining = dict(query_counts)
+            shared = 0
+            for i in range(len(candidate) - q + 1):
+                gram = candidate[i : i + q]
+                if remaining.get(gram, 0) > 0:
+                    remaining[gram] -= 1
+                    shared += 1
+                    if shared >= needed:
+                        break
+            if shared < needed:
+                continue
+        score = distance(query, candidate, k)
+        if score <= k:
+            matches.append((score, candidate))
+    matches.sort()
+    return matches if limit is None else matches[:limit]
+
+
+# Test edit distances and fuzzy matching
+print(f"levenshtein('kitten', 'sitting') = {levenshtein('kitten', 'sitting')}")
+print(
+    f"levenshtein('kitten', 'sitting', max_distance=2) = "
+    f"{levenshtein('kitten', 'sitting', max_distance=2)} (over the cutoff)"
+)
+print(
+    f"levenshtein('abcd', 'acbd') = {levenshtein('abcd', 'acbd')}, "
+    f"damerau_levenshtein = {damerau_levenshtein('abcd', 'acbd')}"
+)
+names = ["jonathan", "johnathan", "jonathon", "nathan", "jon", "joanna", "jonahtan"]
+print(f"best_matches('jonathan', k=2): {best_matches('jonathan', names, 2)}")
+print(
+    f"With transpositions: {best_matches('jonathan', names, 1, distance=damerau_levenshtein)}"
+)
+osa = lambda a, b, max_distance=None: damerau_levenshtein(a, b, max_distance)
+print(f"Wrapped OSA distance: {best_matches('jonathan', names, 1, distance=osa)}")
+
+# ============================================
+# SECTION 6: GREEDY ALGORITHMS
+# ============================================
+print("\n" + "=" * 60)
+print("SECTION 6: GREEDY ALGORITHMS")
+print("=" * 60)
 
 print("\n6.1 Activity Selection")
 print("-" * 30)
@@ -643,6 +2642,374 @@ root = build_huffman_tree(characters, frequencies)
 print("Huffman Codes:")
 print_huffman_codes(root)
 
+print("\n6.3 Streaming Huffman Codec")
+print("-" * 30)
+
+import struct
+from collections import Counter
+
+HUFFMAN_MAGIC = b"HUF1"
+HUFFMAN_HEADER = struct.Struct(">4sQ256B")
+
+
+def count_byte_frequencies(path, chunk_size=1 << 20):
+    """
+    Count byte frequencies of a file without loading it into memory
+    Time Complexity: O(n)
+    Space Complexity: O(chunk_size)
+    """
+    counts = Counter()
+    with open(path, "rb") as source:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            counts.update(chunk)
+    return [counts[byte] for byte in range(256)]
+
+
+def huffman_code_lengths(frequencies):
+    """
+    Huffman code length for each of the 256 byte values (0 = unused)
+    Only the lengths are needed: canonical codes are rebuilt from them.
+    Time Complexity: O(k log k) for k distinct bytes
+    Space Complexity: O(k)
+    """
+    lengths = [0] * 256
+    heap = [(freq, byte) for byte, freq in enumerate(frequencies) if freq]
+    if len(heap) == 1:
+        # A lone symbol still needs one bit; give it a sibling so the code is complete
+        byte = heap[0][1]
+        lengths[byte] = lengths[(byte + 1) % 256] = 1
+        return lengths
+    heapq.heapify(heap)
+    parent = {}
+    next_id = 256
+    while len(heap) > 1:
+        left_freq, left = heapq.heappop(heap)
+        right_freq, right = heapq.heappop(heap)
+        parent[left] = parent[right] = next_id
+        heapq.heappush(heap, (left_freq + right_freq, next_id))
+        next_id += 1
+    for byte, freq in enumerate(frequencies):
+        if freq:
+            node = byte
+            while node in parent:
+                node = parent[node]
+                lengths[byte] += 1
+    return lengths
+
+
+def canonical_huffman_codes(lengths):
+    """
+    Assign canonical codes: shorter codes first, ties broken by byte value
+    Returns a list of bit strings indexed by byte ("" for unused bytes)
+    """
+    codes = [""] * 256
+    code = 0
+    previous_length = 0
+    for length, byte in sorted(
+        (length, byte) for byte, length in enumerate(lengths) if length
+    ):
+        code <<= length - previous_length
+        codes[byte] = format(code, f"0{length}b")
+        code += 1
+        previous_length = length
+    return codes
+
+
+def huffman_compress_file(input_path, output_path, chunk_size=1 << 20):
+    """
+    Streaming Huffman compression
+    Pass 1 counts bytes, pass 2 writes a header (magic, original size and
+    the 256 code lengths) followed by the MSB-first packed bitstream.
+    Time Complexity: O(n)
+    Space Complexity: O(chunk_size)
+    """
+    frequencies = count_byte_frequencies(input_path, chunk_size)
+    lengths = huffman_code_lengths(frequencies)
+    # Each byte maps to its code as a run of '0'/'1' characters, which
+    # int(bits, 2) then packs back into bytes at C speed
+    codes = canonical_huffman_codes(lengths)
+    with open(input_path, "rb") as source, open(output_path, "wb") as target:
+        target.write(HUFFMAN_HEADER.pack(HUFFMAN_MAGIC, sum(frequencies), *lengths))
+        carry = ""
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            bits = carry + "".join(map(codes.__getitem__, chunk))
+            whole = len(bits) - len(bits) % 8
+            if whole:
+                target.write(int(bits[:whole], 2).to_bytes(whole // 8, "big"))
+            carry = bits[whole:]
+        if carry:
+            target.write(int(carry.ljust(8, "0"), 2).to_bytes(1, "big"))
+        return sum(frequencies), target.tell()
+
+
+def _huffman_decode_tables(lengths):
+    """
+    Byte-at-a-time decoding automaton for the canonical code
+    States are the internal nodes of the code tree. For state s and input
+    byte b, entry (s << 8) | b holds the bytes emitted while walking those 8
+    bits and the state left at the end, so decoding never touches single bits.
+    Time Complexity: O(k * 256) to build for k distinct bytes
+    Space Complexity: O(k * 256)
+    """
+    # Rebuild the code tree: children[2 * node + bit] is a node id, or ~byte for a leaf
+    children = [0, 0]
+    for byte, code in enumerate(canonical_huffman_codes(lengths)):
+        node = 0
+        for position, bit in enumerate(code):
+            slot = 2 * node + (bit == "1")
+            if position == len(code) - 1:
+                children[slot] = ~byte
+            else:
+                if children[slot] == 0:
+                    children[slot] = len(children) // 2
+                    children.extend((0, 0))
+                node = children[slot]
+    num_states = len(children) // 2
+
+    # Walk every 4-bit nibble once, then compose pairs of nibbles into bytes
+    nibble_emit = []
+    nibble_next = []
+    for state in range(num_states):
+        for nibble in range(16):
+            node = state
+            emitted = bytearray()
+            for shift in (3, 2, 1, 0):
+                child = children[2 * node + ((nibble >> shift) & 1)]
+                if child < 0:
+                    emitted.append(~child)
+                    node = 0
+                else:
+                    node = child
+            nibble_emit.append(bytes(emitted))
+            nibble_next.append(node)
+
+    emit = []
+    next_state = array("I")
+    for state in range(num_states):
+        for high in range(16):
+            middle = nibble_next[(state << 4) | high]
+            high_emit = nibble_emit[(state << 4) | high]
+            for low in range(16):
+                emit.append(high_emit + nibble_emit[(middle << 4) | low])
+                next_state.append(nibble_next[(middle << 4) | low] << 8)
+    return emit, next_state
+
+
+def huffman_decompress_file(input_path, output_path, chunk_size=1 << 20):
+    """
+    Streaming Huffman decompression driven by an 8-bit lookup table
+    Time Complexity: O(n) - one table lookup per compressed byte
+    Space Complexity: O(chunk_size + table)
+    """
+    with open(input_path, "rb") as source, open(output_path, "wb") as target:
+        header = source.read(HUFFMAN_HEADER.size)
+        if len(header) != HUFFMAN_HEADER.size:
+            raise ValueError("truncated Huffman header")
+        magic, remaining, *lengths = HUFFMAN_HEADER.unpack(header)
+        if magic != HUFFMAN_MAGIC:
+            raise ValueError("not a Huffman-compressed file")
+        if remaining == 0:
+            return 0
+        emit, next_state = _huffman_decode_tables(lengths)
+        state = 0
+        total = remaining
+        while remaining:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                raise ValueError("truncated Huffman bitstream")
+            parts = []
+            append = parts.append
+            for byte in chunk:
+                index = state | byte
+                append(emit[index])
+                state = next_state[index]
+            # The last byte is zero-padded, so drop anything decoded past the end
+            decoded = b"".join(parts)[:remaining]
+            target.write(decoded)
+            remaining -= len(decoded)
+        return total
+
+
+# Test canonical codes on the 6.2 frequencies (bytes 'a'..'e')
+letter_frequencies = [0] * 256
+for char, freq in zip(characters, frequencies):
+    letter_frequencies[ord(char)] = freq
+letter_codes = canonical_huffman_codes(huffman_code_lengths(letter_frequencies))
+print("Canonical codes:", {char: letter_codes[ord(char)] for char in characters})
+
+# Round-trip a file through the streaming codec with small chunks
+work_dir = tempfile.mkdtemp()
+plain_path = os.path.join(work_dir, "plain.txt")
+packed_path = os.path.join(work_dir, "plain.huf")
+unpacked_path = os.path.join(work_dir, "plain.out")
+with open(plain_path, "w", encoding="utf-8") as plain_file:
+    for i in range(2000):
+        plain_file.write(f"record {i}: {random.choice(['alpha', 'beta', 'gamma'])}\n")
+original_size, packed_size = huffman_compress_file(
+    plain_path, packed_path, chunk_size=4096
+)
+huffman_decompress_file(packed_path, unpacked_path, chunk_size=4096)
+with open(plain_path, "rb") as plain_file, open(unpacked_path, "rb") as unpacked_file:
+    round_trip_ok = plain_file.read() == unpacked_file.read()
+print(
+    f"Compressed {original_size:,} -> {packed_size:,} bytes, round trip: {round_trip_ok}"
+)
+
+for file_name in os.listdir(work_dir):
+    os.remove(os.path.join(work_dir, file_name))
+os.rmdir(work_dir)
+
+print("\n6.4 Weighted Interval Scheduling")
+print("-" * 30)
+
+
+def weighted_interval_scheduling(start, finish, weight, presorted=False):
+    """
+    Weighted Interval Scheduling (DP + binary search over finish times)
+    Sorts the intervals by (finish, start) once (skipped when `presorted`,
+    which must already follow that order), then
+    best[j] = max(best[j - 1], weight_j + best[p(j)]), where p(j) is how many
+    intervals finish no later than interval j starts. As in
+    activity_selection(), a start equal to a finish is compatible; ties on
+    finish put zero-length intervals last so p(j) counts [6, 12] for [12, 12].
+    Returns (total_weight, selected indices ordered by finish time).
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+    """
+    n = len(start)
+    if presorted:
+        order = range(n)
+    else:
+        order = sorted(range(n), key=lambda i: (finish[i], start[i]))
+    finishes = [finish[i] for i in order]
+    best = [0] * (n + 1)
+    previous = array("q", [0]) * n
+    take = bytearray(n)
+
+    for j, i in enumerate(order):
+        p = bisect_right(finishes, start[i], 0, j)
+        previous[j] = p
+        with_interval = weight[i] + best[p]
+        if with_interval > best[j]:
+            best[j + 1] = with_interval
+            take[j] = 1
+        else:
+            best[j + 1] = best[j]
+
+    selected = []
+    j = n
+    while j > 0:
+        if take[j - 1]:
+            selected.append(order[j - 1])
+            j = previous[j - 1]
+        else:
+            j -= 1
+    selected.reverse()
+    return best[n], selected
+
+
+def stream_activity_selection(intervals):
+    """
+    Greedy Activity Selection over a stream
+    `intervals` yields (start, finish, ...) records already sorted by finish
+    time, then start (so [6, 12] comes before [12, 12] and both are chosen);
+    chosen records are yielded as they are found and only the last finish
+    time is kept, so the input never has to fit in memory.
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    last_finish = None
+    previous = None
+    for record in intervals:
+        begin, end = record[0], record[1]
+        if previous is not None and (end, begin) < previous:
+            raise ValueError("intervals must be sorted by finish time, then start")
+        previous = (end, begin)
+        if last_finish is None or begin >= last_finish:
+            last_finish = end
+            yield record
+
+
+def _finish_then_start(fields):
+    """Sort key for split "start,finish[,...]" records"""
+    return float(fields[1]), float(fields[0])
+
+
+def schedule_file(
+    input_path, output_path, memory_limit=64 * 1024 * 1024, temp_dir=None
+):
+    """
+    Unweighted scheduling for "start,finish[,...]" CSV files larger than memory
+    Sorts the file by (finish, start) with external_sort_lines() (3.8), then
+    writes the lines chosen by stream_activity_selection().
+    Returns the number of selected intervals.
+    Time Complexity: O(n log n)
+    Space Complexity: O(memory_limit) in memory, O(n) on disk
+    """
+    fd, sorted_path = tempfile.mkstemp(suffix=".sorted", dir=temp_dir)
+    os.close(fd)
+    try:
+        external_sort_lines(
+            input_path,
+            sorted_path,
+            memory_limit=memory_limit,
+            key=lambda line: _finish_then_start(line.split(",", 2)),
+            temp_dir=temp_dir,
+        )
+        selected_count = 0
+        with open(sorted_path, "r", encoding="utf-8") as source, open(
+            output_path, "w", encoding="utf-8"
+        ) as target:
+            records = (
+                (float(fields[0]), float(fields[1]), line)
+                for line in source
+                for fields in (line.split(",", 2),)
+            )
+            for _, _, line in stream_activity_selection(records):
+                target.write(line)
+                selected_count += 1
+        return selected_count
+    finally:
+        os.remove(sorted_path)
+
+
+# Test weighted interval scheduling on the 6.1 activities
+interval_weights = [3, 2, 4, 1, 2, 5]
+total_weight, chosen = weighted_interval_scheduling(start, finish, interval_weights)
+print(f"Weights: {interval_weights}")
+print(f"Best total weight: {total_weight}, intervals: {chosen}")
+unit_total, _ = weighted_interval_scheduling(start, finish, [1] * len(start))
+print(
+    f"Unit weights match activity_selection(): {unit_total == len(activity_selection(start, finish))}"
+)
+
+shuffled = [(8, 9), (0, 6), (1, 2), (5, 7), (3, 4), (5, 9)]
+streamed = list(
+    stream_activity_selection(sorted(shuffled, key=lambda pair: (pair[1], pair[0])))
+)
+print(f"Streaming greedy selection: {streamed}")
+
+work_dir = tempfile.mkdtemp()
+jobs_path = os.path.join(work_dir, "jobs.csv")
+schedule_path = os.path.join(work_dir, "schedule.csv")
+with open(jobs_path, "w", encoding="utf-8") as jobs_file:
+    for job_id in range(500):
+        begin = random.randint(0, 10_000)
+        jobs_file.write(f"{begin},{begin + random.randint(1, 200)},job{job_id}\n")
+selected_count = schedule_file(
+    jobs_path, schedule_path, memory_limit=4096, temp_dir=work_dir
+)
+print(f"Scheduled {selected_count} of 500 jobs from a file sorted externally")
+for file_name in os.listdir(work_dir):
+    os.remove(os.path.join(work_dir, file_name))
+os.rmdir(work_dir)
+
 # ============================================
 # SECTION 7: GRAPH ALGORITHMS
 # ============================================
@@ -756,6 +3123,1005 @@ distances = dijkstra(weighted_graph, "A")
 for vertex, distance in distances.items():
     print(f"To {vertex}: {distance}")
 
+print("\n7.4 Dijkstra with a Priority Queue")
+print("-" * 30)
+
+
+def dijkstra_heap(graph, sources, target=None):
+    """
+    Dijkstra's Shortest Path using a binary heap with lazy deletion
+    Time Complexity: O((V + E) log V)
+    Space Complexity: O(V + E)
+
+    `sources` is a single vertex or a list/set of vertices (multi-source).
+    A tuple is always one vertex, so (row, col) grid nodes need no wrapping.
+    When `target` is given the search stops as soon as it is settled.
+    Returns (distances, predecessors) for every vertex that was reached; after
+    an early stop only settled vertices are kept, so every distance is final.
+    """
+    if not isinstance(sources, (list, set, frozenset)):
+        sources = [sources]
+
+    distances = {}
+    predecessors = {}
+    heap = []
+    for source in sources:
+        distances[source] = 0
+        predecessors[source] = None
+        heap.append((0, source))
+    heapq.heapify(heap)
+
+    settled = set()
+    while heap:
+        distance, current = heapq.heappop(heap)
+        # Stale entry: a shorter distance was already pushed and processed
+        if current in settled:
+            continue
+        settled.add(current)
+
+        if current == target:
+            # Vertices still in the heap only have tentative distances
+            distances = {vertex: distances[vertex] for vertex in settled}
+            predecessors = {vertex: predecessors[vertex] for vertex in settled}
+            break
+
+        for neighbor, weight in graph.get(current, {}).items():
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, float("infinity")):
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = current
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    return distances, predecessors
+
+
+def reconstruct_path(predecessors, target):
+    """Rebuild the path from a source to `target` (empty list if unreachable)"""
+    if target not in predecessors:
+        return []
+
+    path = []
+    vertex = target
+    while vertex is not None:
+        path.append(vertex)
+        vertex = predecessors[vertex]
+    path.reverse()
+    return path
+
+
+# Test heap-based Dijkstra
+distances, predecessors = dijkstra_heap(weighted_graph, "A")
+print(f"Heap Dijkstra distances from 'A': {distances}")
+distances, predecessors = dijkstra_heap(weighted_graph, "A", target="E")
+print(f"Shortest path A -> E: {reconstruct_path(predecessors, 'E')}")
+print(f"Path length: {distances['E']}")
+distances, predecessors = dijkstra_heap(weighted_graph, ["A", "E"])
+print(f"Multi-source distances from A and E: {distances}")
+tuple_graph = {(0, 0): {(0, 1): 1}, (0, 1): {(1, 1): 2}, (1, 1): {}}
+distances, predecessors = dijkstra_heap(tuple_graph, (0, 0))
+print(f"Tuple vertex (0, 0) as a single source: {distances}")
+
+print("\n7.5 Compact CSR Graph")
+print("-" * 30)
+
+
+class CSRNeighbors:
+    """Read-only view of one vertex's neighbors, iterated by label"""
+
+    def __init__(self, graph, vertex_id):
+        self.graph = graph
+        self.begin = graph.offsets[vertex_id]
+        self.end = graph.offsets[vertex_id + 1]
+
+    def __len__(self):
+        return self.end - self.begin
+
+    def __iter__(self):
+        labels = self.graph.labels
+        for target_id in self.graph.targets[self.begin : self.end]:
+            yield labels[target_id]
+
+    def items(self):
+        labels = self.graph.labels
+        targets = self.graph.targets[self.begin : self.end]
+        if self.graph.weights is None:
+            for target_id in targets:
+                yield labels[target_id], 1
+            return
+        weights = self.graph.weights[self.begin : self.end]
+        for target_id, weight in zip(targets, weights):
+            yield labels[target_id], weight
+
+
+class CSRGraph:
+    """
+    Compressed Sparse Row graph
+    Vertices are integer ids 0..V-1; `labels` maps ids to vertex names and
+    `ids` maps names back to ids. The neighbors of vertex v are
+    targets[offsets[v]:offsets[v + 1]] with matching entries in weights;
+    `weights` is None when no edge carries a weight (every edge costs 1).
+
+    Indexing by label returns a neighbor view, so dfs(), bfs(), dijkstra()
+    and dijkstra_heap() accept a CSRGraph wherever they accept a dict graph.
+    """
+
+    def __init__(self, edges=(), vertices=(), directed=True, weight_type="d"):
+        self.labels = []
+        self.ids = {}
+        for vertex in vertices:
+            self._vertex_id(vertex)
+
+        sources = array("i")
+        targets = array("i")
+        weights = array(weight_type)
+        weighted = False
+        for edge in edges:
+            u = self._vertex_id(edge[0])
+            v = self._vertex_id(edge[1])
+            if len(edge) > 2:
+                weight = edge[2]
+                weighted = True
+            else:
+                weight = 1
+            sources.append(u)
+            targets.append(v)
+            weights.append(weight)
+            if not directed:
+                sources.append(v)
+                targets.append(u)
+                weights.append(weight)
+
+        # Counting sort of the edges by source vertex
+        num_vertices = len(self.labels)
+        self.offsets = array("q", [0]) * (num_vertices + 1)
+        for u in sources:
+            self.offsets[u + 1] += 1
+        for v in range(num_vertices):
+            self.offsets[v + 1] += self.offsets[v]
+
+        self.targets = array("i", [0]) * len(sources)
+        self.weights = array(weight_type, [0]) * len(sources) if weighted else None
+        position = self.offsets[:-1]
+        if weighted:
+            for u, v, weight in zip(sources, targets, weights):
+                i = position[u]
+                self.targets[i] = v
+                self.weights[i] = weight
+                position[u] = i + 1
+        else:
+            for u, v in zip(sources, targets):
+                i = position[u]
+                self.targets[i] = v
+                position[u] = i + 1
+
+    def _vertex_id(self, label):
+        """Return the id of `label`, assigning a new one if needed"""
+        vertex_id = self.ids.get(label)
+        if vertex_id is None:
+            vertex_id = len(self.labels)
+            self.ids[label] = vertex_id
+            self.labels.append(label)
+        return vertex_id
+
+    @classmethod
+    def from_dict(cls, graph, weight_type="d"):
+        """Build from a dict-of-lists (unweighted) or dict-of-dicts graph"""
+
+        def edges():
+            for vertex, neighbors in graph.items():
+                if isinstance(neighbors, dict):
+                    for neighbor, weight in neighbors.items():
+                        yield vertex, neighbor, weight
+                else:
+                    for neighbor in neighbors:
+                        yield vertex, neighbor
+
+        return cls(edges(), vertices=graph, weight_type=weight_type)
+
+    @classmethod
+    def from_edge_list(cls, path, directed=False, weight_type="d"):
+        """
+        Load a graph from a text file with one "source target [weight]" per line
+        Blank lines and lines starting with '#' are ignored.
+        """
+
+        def edges():
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    parts = line.split()
+                    if not parts or parts[0].startswith("#"):
+                        continue
+                    if len(parts) > 2:
+                        yield parts[0], parts[1], float(parts[2])
+                    else:
+                        yield parts[0], parts[1]
+
+        return cls(edges(), directed=directed, weight_type=weight_type)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __contains__(self, label):
+        return label in self.ids
+
+    def __getitem__(self, label):
+        return CSRNeighbors(self, self.ids[label])
+
+    def get(self, label, default=None):
+        vertex_id = self.ids.get(label)
+        if vertex_id is None:
+            return default
+        return CSRNeighbors(self, vertex_id)
+
+    def keys(self):
+        return list(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def neighbor_ids(self, vertex_id):
+        """Neighbor ids of `vertex_id` as an array slice"""
+        return self.targets[self.offsets[vertex_id] : self.offsets[vertex_id + 1]]
+
+    def as_numpy(self):
+        """Zero-copy NumPy views of (offsets, targets, weights); weights may be None"""
+        import numpy as np
+
+        weights = None
+        if self.weights is not None:
+            weights = np.frombuffer(self.weights, dtype=np.dtype(self.weights.typecode))
+        return (
+            np.frombuffer(self.offsets, dtype=np.int64),
+            np.frombuffer(self.targets, dtype=np.int32),
+            weights,
+        )
+
+    def memory_bytes(self):
+        """Bytes used by the offset, target and weight arrays (labels excluded)"""
+        columns = (self.offsets, self.targets, self.weights)
+        return sum(
+            column.itemsize * len(column) for column in columns if column is not None
+        )
+
+    def label_bytes(self):
+        """Bytes used by `labels`, `ids` and the label objects themselves"""
+        total = sys.getsizeof(self.labels) + sys.getsizeof(self.ids)
+        return total + sum(sys.getsizeof(label) for label in self.labels)
+
+
+def csr_bfs(graph, start):
+    """
+    Breadth-First Search on CSR ids
+    Reads offsets/targets directly, with no neighbor views or label lookups
+    in the loop; the visiting order doubles as the queue.
+    Returns (order, distances): an array('i') of vertex ids in visiting
+    order and an array('i') of hop counts by id, -1 where unreachable.
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    distances = array("i", [-1]) * len(graph.labels)
+    source = graph.ids[start]
+    distances[source] = 0
+    order = array("i", [source])
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        next_distance = distances[u] + 1
+        for v in targets[offsets[u] : offsets[u + 1]]:
+            if distances[v] < 0:
+                distances[v] = next_distance
+                order.append(v)
+    return order, distances
+
+
+def csr_dijkstra(graph, source, target=None):
+    """
+    Dijkstra's Shortest Path on CSR ids with a binary heap
+    Like dijkstra_heap() but distances and predecessors are arrays indexed
+    by vertex id and edges are read straight from offsets/targets/weights.
+    After an early stop at `target`, unsettled vertices are reset, so every
+    finite distance is final.
+    Returns (distances, predecessors): array('d') with inf where unreached
+    and array('i') with -1 for sources and unreached vertices.
+    Time Complexity: O((V + E) log V)
+    Space Complexity: O(V)
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    num_vertices = len(graph.labels)
+    infinity = float("infinity")
+    distances = array("d", [infinity]) * num_vertices
+    predecessors = array("i", [-1]) * num_vertices
+    settled = bytearray(num_vertices)
+    start = graph.ids[source]
+    stop = graph.ids[target] if target is not None else -1
+    distances[start] = 0.0
+    heap = [(0.0, start)]
+
+    while heap:
+        distance, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        if u == stop:
+            # Every unsettled vertex with a tentative distance is still queued
+            for _, v in heap:
+                if not settled[v]:
+                    distances[v] = infinity
+                    predecessors[v] = -1
+            break
+
+        begin = offsets[u]
+        end = offsets[u + 1]
+        if weights is None:
+            edges = ((v, 1) for v in targets[begin:end])
+        else:
+            edges = zip(targets[begin:end], weights[begin:end])
+        for v, weight in edges:
+            new_distance = distance + weight
+            if new_distance < distances[v]:
+                distances[v] = new_distance
+                predecessors[v] = u
+                heapq.heappush(heap, (new_distance, v))
+
+    return distances, predecessors
+
+
+# Test CSR graph with the existing traversals
+csr_graph = CSRGraph.from_dict(graph)
+print(f"CSR graph: {len(csr_graph)} vertices, {csr_graph.num_edges} edges")
+print("DFS on CSR graph from 'A':", end=" ")
+dfs(csr_graph, "A")
+print("\nBFS on CSR graph from 'A':", end=" ")
+bfs(csr_graph, "A")
+print()
+
+csr_weighted = CSRGraph.from_dict(weighted_graph)
+print(f"Dijkstra on CSR graph: {dijkstra(csr_weighted, 'A')}")
+
+with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as edge_file:
+    edge_file.write("# source target weight\nA B 4\nA C 2\nB C 1\nB D 5\nC D 8\n")
+    edge_file.write("C E 10\nD E 2\n")
+csr_loaded = CSRGraph.from_edge_list(edge_file.name)
+os.remove(edge_file.name)
+distances, predecessors = dijkstra_heap(csr_loaded, "A", target="E")
+print(f"Loaded from edge list, path A -> E: {reconstruct_path(predecessors, 'E')}")
+
+order, hops = csr_bfs(csr_graph, "A")
+print(f"csr_bfs from 'A': {[csr_graph.labels[v] for v in order]}")
+id_distances, _ = csr_dijkstra(csr_weighted, "A")
+print(
+    f"csr_dijkstra matches dijkstra(): "
+    f"{dict(zip(csr_weighted.labels, id_distances)) == dijkstra(weighted_graph, 'A')}"
+)
+print(f"Unweighted CSR stores weights: {csr_graph.weights is not None}")
+
+print("\n7.6 Iterative Graph Traversals")
+print("-" * 30)
+
+
+def iter_dfs(graph, start, visitor=None):
+    """
+    Depth-First Search with an explicit stack of neighbor iterators
+    Yields vertices in the same order as dfs() without printing or recursion.
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    """
+    visited = {start}
+    if visitor:
+        visitor(start)
+    yield start
+    stack = [iter(graph[start])]
+
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                if visitor:
+                    visitor(neighbor)
+                yield neighbor
+                stack.append(iter(graph[neighbor]))
+                break
+        else:
+            stack.pop()
+
+
+def iter_bfs(graph, start, visitor=None):
+    """
+    Breadth-First Search that yields vertices instead of printing
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    """
+    visited = {start}
+    queue = deque([start])
+
+    while queue:
+        vertex = queue.popleft()
+        if visitor:
+            visitor(vertex)
+        yield vertex
+
+        for neighbor in graph[vertex]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+
+
+# Test iterative graph traversals
+print(f"Iterative DFS from 'A': {list(iter_dfs(graph, 'A'))}")
+print(f"Iterative BFS from 'A': {list(iter_bfs(graph, 'A'))}")
+print(f"Iterative DFS on CSR graph: {list(iter_dfs(csr_graph, 'A'))}")
+
+print("\n7.7 Union-Find and Connected Components")
+print("-" * 30)
+
+
+class DisjointSet:
+    """
+    Disjoint-set (union-find) with path compression and union by rank
+    Elements get integer ids in insertion order (`labels`/`ids`, as in
+    CSRGraph); parents live in an array('i') and ranks in a bytearray,
+    since a rank never exceeds log2(n). Elements and edges can be added at
+    any time, so components stay up to date as a graph grows.
+    Time Complexity: O(alpha(n)) amortized per find/union
+    Space Complexity: O(n)
+    """
+
+    def __init__(self, elements=()):
+        self.parent = array("i")
+        self.rank = bytearray()
+        self.labels = []
+        self.ids = {}
+        self.num_sets = 0
+        for element in elements:
+            self.add(element)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Build from a dict graph, a CSRGraph or an iterable of (u, v, ...) edges
+        Edge direction is ignored, so directed graphs give weak components.
+        """
+        if isinstance(graph, CSRGraph):
+            disjoint_set = cls(graph.labels)
+            offsets = graph.offsets
+            targets = graph.targets
+            union = disjoint_set._union_ids
+            for u in range(len(graph.labels)):
+                for v in targets[offsets[u] : offsets[u + 1]]:
+                    union(u, v)
+            return disjoint_set
+        if hasattr(graph, "keys"):
+            disjoint_set = cls(graph.keys())
+            for u in graph.keys():
+                for v in graph[u]:
+                    disjoint_set.union(u, v)
+            return disjoint_set
+        disjoint_set = cls()
+        disjoint_set.add_edges(graph)
+        return disjoint_set
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, element):
+        return element in self.ids
+
+    def add(self, element):
+        """Add `element` as a singleton set (no-op if present); returns its id"""
+        element_id = self.ids.get(element)
+        if element_id is None:
+            element_id = len(self.labels)
+            self.ids[element] = element_id
+            self.labels.append(element)
+            self.parent.append(element_id)
+            self.rank.append(0)
+            self.num_sets += 1
+        return element_id
+
+    def _find_id(self, element_id):
+        parent = self.parent
+        root = element_id
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression: point every vertex on the path straight at the root
+        while parent[element_id] != root:
+            parent[element_id], element_id = root, parent[element_id]
+        return root
+
+    def _union_ids(self, a, b):
+        root_a = self._find_id(a)
+        root_b = self._find_id(b)
+        if root_a == root_b:
+            return False
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self.num_sets -= 1
+        return True
+
+    def find(self, element):
+        """Representative element of the set containing `element`"""
+        return self.labels[self._find_id(self.ids[element])]
+
+    def union(self, a, b):
+        """Merge the sets of `a` and `b`, adding them if new; True if they were apart"""
+        return self._union_ids(self.add(a), self.add(b))
+
+    def connected(self, a, b):
+        """True if `a` and `b` are in the same set"""
+        if a not in self.ids or b not in self.ids:
+            return a == b
+        return self._find_id(self.ids[a]) == self._find_id(self.ids[b])
+
+    def add_edges(self, edges):
+        """Union the endpoints of every (u, v, ...) record; edges may be a stream"""
+        for edge in edges:
+            self.union(edge[0], edge[1])
+
+    def components(self):
+        """Lists of elements per set, in order of each set's first element"""
+        groups = {}
+        for element_id, element in enumerate(self.labels):
+            groups.setdefault(self._find_id(element_id), []).append(element)
+        return list(groups.values())
+
+
+def connected_components(graph):
+    """
+    Connected Components using union-find
+    Accepts a dict graph, a CSRGraph or an iterable of (u, v, ...) edges.
+    Time Complexity: O((V + E) * alpha(V))
+    Space Complexity: O(V)
+    """
+    return DisjointSet.from_graph(graph).components()
+
+
+# Test union-find and connected components
+print(f"Components of the DFS graph: {connected_components(graph)}")
+forest = {"A": ["B"], "B": ["A"], "C": ["D"], "D": ["C"], "E": []}
+print(f"Components of a forest: {connected_components(forest)}")
+print(f"Components from CSR graph: {connected_components(CSRGraph.from_dict(forest))}")
+edge_stream = (edge.split("-") for edge in ["1-2", "3-4", "2-5", "6-6"])
+print(f"Components from an edge stream: {connected_components(edge_stream)}")
+
+network = DisjointSet.from_graph(forest)
+print(f"Sets: {network.num_sets}, A~C connected: {network.connected('A', 'C')}")
+network.add_edges([("B", "C"), ("E", "F")])
+print(
+    f"After adding B-C and E-F: {network.num_sets} sets, A~D: {network.connected('A', 'D')}"
+)
+print(f"Components now: {network.components()}")
+
+print("\n7.8 A* Search and ALT Landmark Heuristics")
+print("-" * 30)
+
+
+def astar(graph, source, target, heuristic=None):
+    """
+    A* Search
+    Like dijkstra_heap(graph, source, target) but the heap is ordered by
+    distance + heuristic(vertex, target), which steers the search toward
+    `target`. The heuristic must never overestimate the remaining distance;
+    without one this is plain Dijkstra.
+    Returns (distances, predecessors) for the expanded vertices. The distance
+    to `target` is exact for any admissible heuristic; the others are final
+    when the heuristic is also consistent (Manhattan on a grid, ALT).
+    Time Complexity: O((V + E) log V) worst case, usually far less
+    Space Complexity: O(V)
+    """
+    if heuristic is None:
+        heuristic = lambda vertex, goal: 0
+    distances = {source: 0}
+    predecessors = {source: None}
+    heap = [(heuristic(source, target), 0, source)]
+    expanded = set()
+
+    while heap:
+        _, distance, current = heapq.heappop(heap)
+        # Stale entry; comparing distances (not a settled set) stays correct
+        # even for heuristics that are admissible but not consistent
+        if distance > distances[current]:
+            continue
+        expanded.add(current)
+        if current == target:
+            distances = {vertex: distances[vertex] for vertex in expanded}
+            predecessors = {vertex: predecessors[vertex] for vertex in expanded}
+            break
+
+        for neighbor, weight in graph.get(current, {}).items():
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, float("infinity")):
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = current
+                heapq.heappush(
+                    heap,
+                    (
+                        new_distance + heuristic(neighbor, target),
+                        new_distance,
+                        neighbor,
+                    ),
+                )
+
+    return distances, predecessors
+
+
+class LandmarkHeuristic:
+    """
+    ALT (A*, Landmarks, Triangle inequality) preprocessing
+    Picks `num_landmarks` vertices by farthest-point selection and runs one
+    Dijkstra from each. Distances live in a single array('d') with each
+    vertex's K values stored contiguously, so one query slices one row per
+    vertex. By the triangle inequality, |d(L, t) - d(L, v)| never exceeds
+    d(v, t), giving an admissible and consistent A* heuristic.
+    For directed graphs distances to each landmark (on the reversed graph)
+    are stored too. `directed=None` checks every edge for a reverse edge of
+    equal weight, since the symmetric bound is not admissible otherwise.
+    Time Complexity: O(K * (V + E) log V) preprocessing, O(K) per heuristic call
+    Space Complexity: O(K * V)
+    """
+
+    def __init__(self, graph, num_landmarks=8, directed=None, landmarks=None):
+        # Vertices that only appear as neighbors still need a row
+        labels = dict.fromkeys(graph.keys())
+        for neighbors in graph.values():
+            labels.update(dict.fromkeys(neighbors))
+        self.labels = list(labels)
+        self.ids = {vertex: i for i, vertex in enumerate(self.labels)}
+        if directed is None:
+            directed = not self._is_symmetric(graph)
+        self.directed = directed
+        infinity = float("infinity")
+
+        if landmarks is None:
+            # Farthest-point selection: each landmark is the vertex farthest
+            # from all landmarks so far (the first, from an arbitrary vertex)
+            landmarks = []
+            runs = []
+            closest, _ = dijkstra_heap(graph, self.labels[0])
+            for _ in range(min(num_landmarks, len(self.labels))):
+                landmark = max(
+                    self.labels, key=lambda vertex: closest.get(vertex, infinity)
+                )
+                distances, _ = dijkstra_heap(graph, landmark)
+                landmarks.append(landmark)
+                runs.append(distances)
+                for vertex, distance in distances.items():
+                    if distance < closest.get(vertex, infinity):
+                        closest[vertex] = distance
+        else:
+            runs = [dijkstra_heap(graph, landmark)[0] for landmark in landmarks]
+
+        self.landmarks = list(landmarks)
+        self.num_landmarks = len(self.landmarks)
+        size = self.num_landmarks * len(self.labels)
+        self.from_landmark = array("d", [infinity]) * size
+        for k, distances in enumerate(runs):
+            self._fill_column(self.from_landmark, k, distances)
+        self.to_landmark = None
+        if directed:
+            reverse_graph = self._reverse(graph)
+            self.to_landmark = array("d", [infinity]) * size
+            for k, landmark in enumerate(self.landmarks):
+                self._fill_column(
+                    self.to_landmark, k, dijkstra_heap(reverse_graph, landmark)[0]
+                )
+        self._target = None
+        self._target_rows = None
+
+    @staticmethod
+    def _is_symmetric(graph):
+        """True if every edge u -> v has a reverse edge v -> u of equal weight"""
+        for u, neighbors in graph.items():
+            for v, weight in neighbors.items():
+                if graph.get(v, {}).get(u) != weight:
+                    return False
+        return True
+
+    @staticmethod
+    def _reverse(graph):
+        reverse_graph = {vertex: {} for vertex in graph.keys()}
+        for u in graph.keys():
+            for v, weight in graph[u].items():
+                reverse_graph.setdefault(v, {})[u] = weight
+        return reverse_graph
+
+    def _fill_column(self, table, k, distances):
+        count = self.num_landmarks
+        ids = self.ids
+        for vertex, distance in distances.items():
+            table[ids[vertex] * count + k] = distance
+
+    def _rows(self, vertex):
+        count = self.num_landmarks
+        start = self.ids[vertex] * count
+        forward = self.from_landmark[start : start + count]
+        backward = self.to_landmark[start : start + count] if self.directed else None
+        return forward, backward
+
+    def __call__(self, vertex, target):
+        """Lower bound on the distance from `vertex` to `target`"""
+        if target != self._target:
+            self._target = target
+            self._target_rows = self._rows(target)
+        target_forward, target_backward = self._target_rows
+        forward, backward = self._rows(vertex)
+        bound = 0
+        if self.directed:
+            # d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L)
+            for from_v, from_t in zip(forward, target_forward):
+                if from_t > from_v and from_t - from_v > bound:
+                    bound = from_t - from_v
+            for to_v, to_t in zip(backward, target_backward):
+                if to_v > to_t and to_v - to_t > bound:
+                    bound = to_v - to_t
+        else:
+            for from_v, from_t in zip(forward, target_forward):
+                if from_v != from_t:
+                    difference = abs(from_t - from_v)
+                    if difference > bound:
+                        bound = difference
+        return bound
+
+    def memory_bytes(self):
+        """Bytes used by the landmark distance tables"""
+        tables = [self.from_landmark] + ([self.to_landmark] if self.directed else [])
+        return sum(table.itemsize * len(table) for table in tables)
+
+
+# Test A* and ALT on the weighted graph from 7.3
+distances, predecessors = astar(weighted_graph, "A", "E")
+print(
+    f"A* without heuristic, A -> E: {reconstruct_path(predecessors, 'E')}, {distances['E']}"
+)
+alt = LandmarkHeuristic(weighted_graph, num_landmarks=2)
+distances, predecessors = astar(weighted_graph, "A", "E", heuristic=alt)
+print(f"Landmarks: {alt.landmarks}, lower bound A -> E: {alt('A', 'E')}")
+print(f"A* with ALT, A -> E: {reconstruct_path(predecessors, 'E')}, {distances['E']}")
+one_way = {"A": {"B": 100, "C": 1}, "B": {"C": 1}}  # "C" has no outgoing edges
+one_way_alt = LandmarkHeuristic(one_way, landmarks=["A"])
+print(
+    f"One-way graph detected as directed: {one_way_alt.directed}, "
+    f"bound B -> C: {one_way_alt('B', 'C')} (true distance 1)"
+)
+
+
+def grid_road_graph(side, max_weight=10, seed=42):
+    """side x side grid of (row, col) vertices with random travel times >= 1"""
+    rng = random.Random(seed)
+    road_graph = {(row, col): {} for row in range(side) for col in range(side)}
+    for row in range(side):
+        for col in range(side):
+            for neighbor in ((row + 1, col), (row, col + 1)):
+                if neighbor in road_graph:
+                    weight = rng.randint(1, max_weight)
+                    road_graph[(row, col)][neighbor] = weight
+                    road_graph[neighbor][(row, col)] = weight
+    return road_graph
+
+
+def manhattan(vertex, goal):
+    """Admissible on grid_road_graph() because every edge costs at least 1"""
+    return abs(vertex[0] - goal[0]) + abs(vertex[1] - goal[1])
+
+
+road_graph = grid_road_graph(20)
+corner_to_corner = ((0, 0), (19, 19))
+for name, heuristic in [
+    ("Dijkstra", None),
+    ("Manhattan", manhattan),
+    ("ALT", LandmarkHeuristic(road_graph, num_landmarks=4)),
+]:
+    distances, _ = astar(road_graph, *corner_to_corner, heuristic=heuristic)
+    print(
+        f"{name:<10} distance {distances[(19, 19)]}, vertices settled: {len(distances)}"
+    )
+
+print("\n7.9 Level-Synchronous Parallel BFS")
+print("-" * 30)
+
+
+import re
+
+
+def _expand_frontier(offsets, targets, visited, frontier):
+    """Unvisited neighbors of the frontier vertices, each listed once and marked visited"""
+    found = array("i")
+    for u in frontier:
+        for v in targets[offsets[u] : offsets[u + 1]]:
+            byte = v >> 3
+            bit = 1 << (v & 7)
+            if not visited[byte] & bit:
+                visited[byte] |= bit
+                found.append(v)
+    return found
+
+
+def _mark_frontier(offsets, targets, visited, frontier, found):
+    """Set the `found` bit of every unvisited neighbor (visited is read-only)"""
+    count = 0
+    for u in frontier:
+        for v in targets[offsets[u] : offsets[u + 1]]:
+            byte = v >> 3
+            bit = 1 << (v & 7)
+            if not (visited[byte] | found[byte]) & bit:
+                found[byte] |= bit
+                count += 1
+    return count
+
+
+# Bit positions set in each byte value, for turning a bitset back into ids
+_BIT_POSITIONS = [
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+]
+
+
+def _bitset_ids(bitset):
+    """array('i') of the positions of the set bits, in increasing order"""
+    ids = array("i")
+    for match in re.finditer(rb"[^\x00]", bitset):
+        base = match.start() * 8
+        ids.extend([base + bit for bit in _BIT_POSITIONS[match.group()[0]]])
+    return ids
+
+
+def _expand_shared_frontier(names, num_vertices, num_edges, lo, hi, slot):
+    """Worker: mark the unvisited neighbors of frontier[lo:hi] in bitset `slot`"""
+    segments = {
+        key: shared_memory.SharedMemory(name=name) for key, name in names.items()
+    }
+    try:
+        bitset_bytes = (num_vertices + 7) // 8
+        offsets = segments["offsets"].buf[: (num_vertices + 1) * 8].cast("q")
+        targets = segments["targets"].buf[: num_edges * 4].cast("i")
+        frontier = segments["frontier"].buf[lo * 4 : hi * 4].cast("i")
+        visited = segments["visited"].buf[:bitset_bytes]
+        found = segments["found"].buf[slot * bitset_bytes : (slot + 1) * bitset_bytes]
+        found[:] = bytes(bitset_bytes)
+        count = _mark_frontier(offsets, targets, visited, frontier, found)
+        for view in (offsets, targets, frontier, visited, found):
+            view.release()
+        return count
+    finally:
+        for segment in segments.values():
+            segment.close()
+
+
+def parallel_bfs(graph, start, workers=None, min_chunk=4096):
+    """
+    Level-synchronous Breadth-First Search over worker processes
+    The CSR adjacency (offsets/targets), the visited bitset and the current
+    frontier live in shared memory. Each level, the frontier is split across
+    workers; each one sets the bits of the unvisited neighbors it finds in
+    its own shared bitset. The main process ORs those bitsets together as
+    big integers, which drops duplicates between workers in bulk, and reads
+    the next frontier off the nonzero bytes. Frontiers smaller than `min_chunk`
+    vertices per worker are expanded in-process, straight into the next
+    frontier, so deep graphs cost O(V + E) rather than a bitset scan per level.
+    `graph` is a CSRGraph (dict graphs are converted). Returns (frontiers,
+    distances): one array('i') of vertex ids per level, and an array('i') of
+    levels indexed by vertex id, -1 where unreachable. graph.labels maps ids
+    back to vertices.
+    Time Complexity: O((V + E) / p + V) for p workers, plus O(p * V / 8)
+    bulk bitset work per parallel level
+    Space Complexity: O(V + E + p * V / 8) shared memory
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    num_vertices = len(graph.labels)
+    num_edges = len(graph.targets)
+    workers = workers or os.cpu_count() or 1
+    source = graph.ids[start]
+    bitset_bytes = (num_vertices + 7) // 8
+
+    distances = array("i", [-1]) * num_vertices
+    distances[source] = 0
+    frontiers = [array("i", [source])]
+
+    sizes = {
+        "offsets": len(graph.offsets) * 8,
+        "targets": num_edges * 4,
+        "frontier": num_vertices * 4,
+        "visited": bitset_bytes,
+        "found": bitset_bytes * workers,
+    }
+    segments = {
+        key: shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for key, size in sizes.items()
+    }
+    try:
+        segments["offsets"].buf[: sizes["offsets"]] = graph.offsets.tobytes()
+        segments["targets"].buf[: sizes["targets"]] = graph.targets.tobytes()
+        names = {key: segment.name for key, segment in segments.items()}
+        visited = segments["visited"].buf
+        visited[source >> 3] |= 1 << (source & 7)
+        pool = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(workers, mp_context=_pool_context())
+
+        while True:
+            frontier = frontiers[-1]
+            chunk = max(min_chunk, -(-len(frontier) // workers))
+            ranges = [
+                (lo, min(lo + chunk, len(frontier)))
+                for lo in range(0, len(frontier), chunk)
+            ]
+            level = len(frontiers)
+            if pool is None or len(ranges) == 1:
+                next_frontier = _expand_frontier(
+                    graph.offsets, graph.targets, visited, frontier
+                )
+            else:
+                segments["frontier"].buf[: len(frontier) * 4] = frontier.tobytes()
+                futures = [
+                    pool.submit(
+                        _expand_shared_frontier,
+                        names,
+                        num_vertices,
+                        num_edges,
+                        lo,
+                        hi,
+                        slot,
+                    )
+                    for slot, (lo, hi) in enumerate(ranges)
+                ]
+                for future in futures:
+                    future.result()
+                # Workers may mark the same vertex; OR-ing the bitsets merges them
+                found = segments["found"].buf
+                combined = 0
+                for slot in range(len(ranges)):
+                    combined |= int.from_bytes(
+                        found[slot * bitset_bytes : (slot + 1) * bitset_bytes],
+                        "little",
+                    )
+                visited[:bitset_bytes] = (
+                    int.from_bytes(visited[:bitset_bytes], "little") | combined
+                ).to_bytes(bitset_bytes, "little")
+                next_frontier = _bitset_ids(combined.to_bytes(bitset_bytes, "little"))
+            for v in next_frontier:
+                distances[v] = level
+            if not next_frontier:
+                break
+            frontiers.append(next_frontier)
+
+        return frontiers, distances
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        for segment in segments.values():
+            segment.close()
+            segment.unlink()
+
+
+# Test level-synchronous BFS (worker processes need the main-module guard)
+frontiers, levels = parallel_bfs(csr_graph, "A", workers=1)
+print("BFS levels from 'A':", [[csr_graph.labels[v] for v in f] for f in frontiers])
+if __name__ == "__main__":
+    bfs_graph = CSRGraph(
+        (random.randrange(5000), random.randrange(5000)) for _ in range(20_000)
+    )
+    bfs_start = bfs_graph.labels[0]
+    frontiers, levels = parallel_bfs(bfs_graph, bfs_start, workers=4, min_chunk=64)
+    _, serial_levels = parallel_bfs(bfs_graph, bfs_start, workers=1)
+    reached = sum(len(frontier) for frontier in frontiers)
+    print(
+        f"Parallel BFS (4 workers): {len(frontiers)} levels, {reached} vertices, "
+        f"matches iter_bfs: {reached == len(list(iter_bfs(bfs_graph, bfs_start)))}, "
+        f"matches serial levels: {levels == serial_levels}"
+    )
+
 # ============================================
 # SECTION 8: PERFORMANCE ANALYSIS
 # ============================================
@@ -769,15 +4135,9 @@ print("-" * 30)
 import time
 import random
 
-
-def measure_time(func, *args, iterations=1000):
-    """Measure execution time of a function"""
-    start_time = time.time()
-    for _ in range(iterations):
-        func(*args)
-    end_time = time.time()
-    return (end_time - start_time) / iterations
-
+# bench_utils lives with the other utility modules of the packages chapter
+# (the path was added to sys.path in 5.4)
+from bench_utils import compare_results, load_results, run_benchmark, save_results
 
 # Test sorting algorithms performance
 sizes = [100, 500, 1000]
@@ -787,29 +4147,60 @@ algorithms = [
     ("Insertion Sort", insertion_sort),
     ("Merge Sort", merge_sort),
     ("Quick Sort", quick_sort),
+    ("Introsort", introsort),
+    ("Counting Sort", counting_sort),
+    ("Radix Sort", radix_sort),
 ]
 
-print("Sorting Algorithm Performance (seconds per operation):")
-print(
-    f"{'Size':<6} {'Bubble':<10} {'Selection':<10} {'Insertion':<10} {'Merge':<10} {'Quick':<10}"
-)
-print("-" * 60)
+print("Sorting Algorithm Performance (median seconds per operation):")
+print(f"{'Size':<6} " + " ".join(f"{name.split()[0]:<10}" for name, _ in algorithms))
+print("-" * (7 + 11 * len(algorithms)))
 
+sort_results = []
 for size in sizes:
     arr = [random.randint(1, 1000) for _ in range(size)]
     times = []
 
     for name, algorithm in algorithms:
         if size <= 1000 or name in ["Merge Sort", "Quick Sort"]:
-            time_taken = measure_time(algorithm, arr.copy())
-            times.append(f"{time_taken:.6f}")
+            # Every call gets a fresh copy, so in-place sorts never see sorted input
+            result = run_benchmark(
+                algorithm,
+                name=f"{name} ({size})",
+                setup=lambda: (arr.copy(),),
+                repeat=9,
+            )
+            sort_results.append(result)
+            times.append(f"{result.median:.6f}")
         else:
             times.append("N/A")
 
+    print(f"{size:<6} " + " ".join(f"{time_taken:<10}" for time_taken in times))
+
+print(f"\n{'Benchmark':<24} {'Median':<10} {'p95':<10} {'Stdev':<10}")
+print("-" * 54)
+for result in sort_results[-len(algorithms) :]:
     print(
-        f"{size:<6} {times[0]:<10} {times[1]:<10} {times[2]:<10} {times[3]:<10} {times[4]:<10}"
+        f"{result.name:<24} {result.median:<10.6f} {result.p95:<10.6f} {result.stdev:<10.6f}"
     )
 
+# Set BENCHMARK_BASELINE to a JSON path: the first run saves it and later
+# runs are compared against it, flagging regressions
+baseline_path = os.environ.get("BENCHMARK_BASELINE")
+comparisons = []
+if baseline_path and os.path.exists(baseline_path):
+    comparisons = compare_results(sort_results, load_results(baseline_path))
+    print(f"\nCompared with baseline {baseline_path}:")
+elif baseline_path:
+    save_results(sort_results, baseline_path)
+    print(f"\nSaved baseline to {baseline_path}")
+else:
+    # Comparing two back-to-back runs of the same code would only show noise
+    print("\nSet BENCHMARK_BASELINE to a JSON path to track regressions")
+for row in comparisons:
+    change = "-" if row["change"] is None else f"{row['change']:+.1%}"
+    print(f"{row['name']:<24} {change:<8} {row['status']}")
+
 print("\n8.2 Space Complexity Analysis")
 print("-" * 30)
 print(
@@ -822,19 +4213,996 @@ Sorting Algorithms:
 - Insertion Sort: O(1) - In-place sorting
 - Merge Sort: O(n) - Requires extra space
 - Quick Sort: O(log n) - Recursion stack
+- Introsort: O(log n) - In-place, recursing only on the smaller partition
+- Counting Sort: O(n + k) - Count array over the key range (radix fallback when k >> n)
+- Radix Sort: O(n + 2^b) - Index array plus one bucket count per digit
 
 Searching Algorithms:
 - Linear Search: O(1) - No extra space
 - Binary Search: O(1) - No extra space
 - Recursive Binary Search: O(log n) - Recursion stack
 
+Recursion:
+- Binary Tree (TreeNode): O(n) - One object plus a __dict__ per node
+- ArrayTree: O(n) - 16 bytes per node in three array columns
+- Tower of Hanoi: O(n) - Recursion stack
+- Hanoi Move Generator: O(1) - Each move computed from its index; packed chunks O(2^20)
+
 Dynamic Programming:
-- Fibonacci (memoized): O(n) - Memoization table
+- Fibonacci (memoized): O(max_size) - Bounded LRU cache
+- Fibonacci (fast doubling): O(1) - Iterates over the bits of n
 - LCS: O(m * n) - DP table
+- LCS (Hirschberg): O(m + n) - Two DP rows at a time
+- LCS (bit-parallel): O(n) bits - One big integer per row
 - Knapsack: O(n * W) - DP table
+- Knapsack (rolling row): O(W) - One DP row, O(n * W / 8) bytes to recover items
+- Coin Change Solver: O(A) - 4-byte array columns, shared by every query
+- Edit Distance: O(min(m, n)) - Three DP rows, only the k-band is filled
+
+Greedy Algorithms:
+- Huffman Codec: O(chunk_size) - Files are streamed; decode table has 256 entries per tree node
+- Weighted Interval Scheduling: O(n) - DP values, predecessor array and take flags
+
+Graph Algorithms:
+- CSR Graph: O(V + E) - 8-byte offsets, 4-byte targets, weights only if weighted
+- Union-Find: O(V) - 4-byte parent ids plus 1-byte ranks
+- ALT Landmarks: O(K * V) - One 8-byte distance per vertex and landmark
+- Parallel BFS: O(V + E) shared memory plus V-bit visited and per-worker found bitsets
 """
 )
 
+print("\n8.3 Dijkstra: Simple vs Priority Queue")
+print("-" * 30)
+
+
+def generate_sparse_graph(num_vertices, avg_degree=4, max_weight=10, seed=42):
+    """Generate a random connected sparse weighted graph with integer vertices"""
+    rng = random.Random(seed)
+    graph = {vertex: {} for vertex in range(num_vertices)}
+
+    # A random spanning chain keeps the graph connected
+    for vertex in range(1, num_vertices):
+        other = rng.randrange(vertex)
+        weight = rng.randint(1, max_weight)
+        graph[vertex][other] = weight
+        graph[other][vertex] = weight
+
+    for _ in range(num_vertices * (avg_degree - 2) // 2):
+        u = rng.randrange(num_vertices)
+        v = rng.randrange(num_vertices)
+        if u != v:
+            weight = rng.randint(1, max_weight)
+            graph[u][v] = weight
+            graph[v][u] = weight
+
+    return graph
+
+
+def benchmark_dijkstra(sizes=(10_000, 100_000, 1_000_000), naive_limit=10_000):
+    """Compare dijkstra() and dijkstra_heap() on synthetic sparse graphs"""
+    print(f"{'Vertices':<10} {'Simple':<12} {'Heap':<12} {'Heap+target':<12}")
+    print("-" * 48)
+
+    for size in sizes:
+        graph = generate_sparse_graph(size)
+        target_vertex = size - 1
+
+        if size <= naive_limit:
+            start_time = time.perf_counter()
+            dijkstra(graph, 0)
+            simple_time = f"{time.perf_counter() - start_time:.4f}"
+        else:
+            simple_time = "N/A"
+
+        start_time = time.perf_counter()
+        dijkstra_heap(graph, 0)
+        heap_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        dijkstra_heap(graph, 0, target=target_vertex)
+        target_time = time.perf_counter() - start_time
+
+        print(f"{size:<10} {simple_time:<12} {heap_time:<12.4f} {target_time:<12.4f}")
+
+
+# Small sizes keep the tutorial fast; call benchmark_dijkstra() for the full run
+print("Dijkstra performance (seconds per run):")
+benchmark_dijkstra(sizes=[1_000, 10_000], naive_limit=2_000)
+
+print("\n8.4 Graph Representation: Dict vs CSR")
+print("-" * 30)
+
+import io
+from contextlib import redirect_stdout
+
+
+def dict_graph_bytes(graph):
+    """Approximate bytes used by a dict-of-dicts graph and its key/weight objects"""
+    total = sys.getsizeof(graph)
+    for vertex, neighbors in graph.items():
+        total += sys.getsizeof(vertex) + sys.getsizeof(neighbors)
+        for neighbor, weight in neighbors.items():
+            total += sys.getsizeof(neighbor) + sys.getsizeof(weight)
+    return total
+
+
+def benchmark_graph_representations(sizes=(10_000, 100_000, 1_000_000)):
+    """Compare memory per edge and traversal throughput for dict and CSR graphs"""
+    print(
+        f"{'Vertices':<10} {'Format':<10} {'Bytes/edge':<12} {'Arrays only':<12} "
+        f"{'BFS edges/s':<14} {'Dijkstra edges/s':<16}"
+    )
+    print("-" * 78)
+
+    def quiet_bfs(representation, start):
+        with redirect_stdout(io.StringIO()):
+            bfs(representation, start)
+
+    for size in sizes:
+        dict_graph = generate_sparse_graph(size)
+        csr = CSRGraph.from_dict(dict_graph)
+        num_edges = csr.num_edges
+        # Both figures include the vertex labels: traversals need them too
+        csr_bytes = csr.memory_bytes() + csr.label_bytes()
+
+        for name, representation, num_bytes, array_bytes, run_bfs, run_dijkstra in [
+            (
+                "dict",
+                dict_graph,
+                dict_graph_bytes(dict_graph),
+                None,
+                quiet_bfs,
+                dijkstra_heap,
+            ),
+            ("CSR view", csr, csr_bytes, csr.memory_bytes(), quiet_bfs, dijkstra_heap),
+            ("CSR ids", csr, csr_bytes, csr.memory_bytes(), csr_bfs, csr_dijkstra),
+        ]:
+            start_time = time.perf_counter()
+            run_bfs(representation, 0)
+            bfs_rate = num_edges / (time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
+            run_dijkstra(representation, 0)
+            dijkstra_rate = num_edges / (time.perf_counter() - start_time)
+
+            arrays_column = (
+                "-" if array_bytes is None else f"{array_bytes / num_edges:.1f}"
+            )
+            print(
+                f"{size:<10} {name:<10} {num_bytes / num_edges:<12.1f} "
+                f"{arrays_column:<12} {bfs_rate:<14,.0f} {dijkstra_rate:<16,.0f}"
+            )
+
+
+print("Graph representation comparison:")
+benchmark_graph_representations(sizes=[10_000])
+
+print("\n8.5 Deep Inputs: Recursive vs Iterative Traversals")
+print("-" * 30)
+
+
+def build_path_graph(num_vertices):
+    """A path 0 - 1 - ... - (n-1): the worst case for recursive DFS"""
+    graph = {vertex: [] for vertex in range(num_vertices)}
+    for vertex in range(1, num_vertices):
+        graph[vertex - 1].append(vertex)
+        graph[vertex].append(vertex - 1)
+    return graph
+
+
+def build_degenerate_tree(num_nodes):
+    """A right-leaning chain of TreeNodes: the worst case for recursive traversals"""
+    root = TreeNode(0)
+    node = root
+    for val in range(1, num_nodes):
+        node.right = TreeNode(val)
+        node = node.right
+    return root
+
+
+def benchmark_deep_traversals(num_nodes=1_000_000):
+    """Time recursive and iterative traversals on a path graph and a chain tree"""
+    path_graph = build_path_graph(num_nodes)
+    chain_tree = build_degenerate_tree(num_nodes)
+
+    cases = [
+        ("dfs (recursive)", lambda: dfs(path_graph, 0)),
+        ("iter_dfs", lambda: sum(1 for _ in iter_dfs(path_graph, 0))),
+        ("inorder (recursive)", lambda: inorder_traversal(chain_tree)),
+        ("iter_inorder", lambda: sum(1 for _ in iter_inorder(chain_tree))),
+        ("iter_preorder", lambda: sum(1 for _ in iter_preorder(chain_tree))),
+        ("iter_postorder", lambda: sum(1 for _ in iter_postorder(chain_tree))),
+    ]
+
+    print(f"{'Traversal':<22} {'Nodes':<10} {'Seconds':<10}")
+    print("-" * 44)
+    for name, run in cases:
+        start_time = time.perf_counter()
+        try:
+            with redirect_stdout(io.StringIO()):
+                run()
+            elapsed = f"{time.perf_counter() - start_time:.4f}"
+        except RecursionError:
+            elapsed = "RecursionError"
+        print(f"{name:<22} {num_nodes:<10} {elapsed:<10}")
+
+
+print("Traversals on deep inputs:")
+benchmark_deep_traversals(num_nodes=100_000)
+
+print("\n8.6 Parallel Merge Sort Scaling")
+print("-" * 30)
+
+
+def benchmark_parallel_sort(size=10_000_000, worker_counts=(2, 4, 8, 16)):
+    """
+    Time parallel_merge_sort at several worker counts against sorted() and merge_sort
+    sorted() is the serial baseline (parallel_merge_sort with one worker is sorted())
+    """
+    data = [random.randint(0, 2**62) for _ in range(size)]
+
+    print(f"{'Method':<24} {'Seconds':<10}")
+    print("-" * 34)
+    for name, run in [
+        ("sorted() (serial)", lambda: sorted(data)),
+        ("merge_sort", lambda: merge_sort(data)),
+    ]:
+        start_time = time.perf_counter()
+        run()
+        print(f"{name:<24} {time.perf_counter() - start_time:<10.4f}")
+
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        parallel_merge_sort(data, workers=workers)
+        elapsed = time.perf_counter() - start_time
+        print(f"{f'parallel ({workers} workers)':<24} {elapsed:<10.4f}")
+
+
+if __name__ == "__main__":
+    print(f"Sorting 200,000 integers on {os.cpu_count()} CPU(s):")
+    benchmark_parallel_sort(size=200_000, worker_counts=(2, 4))
+
+print("\n8.7 Quick Sort vs Introsort: Time and Allocations")
+print("-" * 30)
+
+import tracemalloc
+
+
+def benchmark_sort_allocations(size=100_000):
+    """Report wall time and peak traced allocations for each input pattern"""
+    rng = random.Random(42)
+    patterns = {
+        "random": [rng.randint(0, size) for _ in range(size)],
+        "sorted": list(range(size)),
+        "reversed": list(range(size, 0, -1)),
+        "few unique": [rng.randint(0, 9) for _ in range(size)],
+    }
+    sorters = [
+        ("Merge Sort", merge_sort),
+        ("Quick Sort", quick_sort),
+        ("Introsort", introsort),
+    ]
+
+    print(f"{'Input':<12} {'Algorithm':<12} {'Seconds':<10} {'Peak KiB':<10}")
+    print("-" * 46)
+    for pattern, data in patterns.items():
+        for name, sorter in sorters:
+            arr = data.copy()
+            start_time = time.perf_counter()
+            sorter(arr)
+            elapsed = time.perf_counter() - start_time
+
+            # Separate run under tracemalloc so tracing doesn't skew the timing
+            arr = data.copy()
+            tracemalloc.start()
+            sorter(arr)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"{pattern:<12} {name:<12} {elapsed:<10.4f} {peak / 1024:<10.1f}")
+
+
+print("Sorting 20,000 items:")
+benchmark_sort_allocations(size=20_000)
+
+print("\n8.8 Batched Binary Search Throughput")
+print("-" * 30)
+
+
+def benchmark_binary_search_many(array_size=1_000_000, num_queries=10_000_000):
+    """Queries per second for a binary_search() loop vs binary_search_many()"""
+    rng = random.Random(42)
+    arr = sorted(rng.sample(range(array_size * 4), array_size))
+    queries = [rng.randrange(array_size * 4) for _ in range(num_queries)]
+    sorted_queries = sorted(queries)
+
+    cases = [
+        ("binary_search loop", lambda: [binary_search(arr, q) for q in queries]),
+        ("many (unsorted)", lambda: binary_search_many(arr, queries, use_numpy=False)),
+        (
+            "many (sorted sweep)",
+            lambda: binary_search_many(arr, sorted_queries, use_numpy=False),
+        ),
+    ]
+    if HAS_NUMPY:
+        cases.append(
+            ("many (numpy)", lambda: binary_search_many(arr, queries, use_numpy=True))
+        )
+
+    print(f"{'Method':<22} {'Queries/s':<14}")
+    print("-" * 36)
+    for name, run in cases:
+        start_time = time.perf_counter()
+        run()
+        rate = num_queries / (time.perf_counter() - start_time)
+        print(f"{name:<22} {rate:<14,.0f}")
+
+
+print("100,000 queries against 100,000 sorted integers:")
+benchmark_binary_search_many(array_size=100_000, num_queries=100_000)
+
+print("\n8.9 SortedList vs bisect.insort")
+print("-" * 30)
+
+
+def benchmark_sorted_list(size=1_000_000):
+    """Time inserts, rank queries and deletes on SortedList vs a plain list"""
+    rng = random.Random(42)
+    values = [rng.random() for _ in range(size)]
+
+    print(f"{'Container':<18} {'Insert':<10} {'Rank':<10} {'Delete':<10}")
+    print("-" * 48)
+
+    plain = []
+    start_time = time.perf_counter()
+    for value in values:
+        insort(plain, value)
+    insert_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for value in values:
+        bisect_left(plain, value)
+    rank_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for value in values:
+        del plain[bisect_left(plain, value)]
+    delete_time = time.perf_counter() - start_time
+    print(
+        f"{'list + insort':<18} {insert_time:<10.4f} {rank_time:<10.4f} {delete_time:<10.4f}"
+    )
+
+    container = SortedList()
+    start_time = time.perf_counter()
+    for value in values:
+        container.add(value)
+    insert_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for value in values:
+        container.rank(value)
+    rank_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for value in values:
+        container.remove(value)
+    delete_time = time.perf_counter() - start_time
+    print(
+        f"{'SortedList':<18} {insert_time:<10.4f} {rank_time:<10.4f} {delete_time:<10.4f}"
+    )
+
+
+print("50,000 random floats (seconds per phase):")
+benchmark_sorted_list(size=50_000)
+
+print("\n8.10 Selection vs Full Sort")
+print("-" * 30)
+
+
+def benchmark_selection(size=10_000_000, k=100):
+    """Compare select_kth/top_k with sorting everything first"""
+    rng = random.Random(42)
+    data = [rng.random() for _ in range(size)]
+
+    cases = [
+        ("sorted()[k]", lambda: sorted(data)[size // 2]),
+        ("select_kth (median)", lambda: select_kth(data, size // 2)),
+        ("sorted()[-k:]", lambda: sorted(data)[-k:]),
+        ("top_k", lambda: top_k(data, k)),
+        ("top_k (generator)", lambda: top_k((x for x in data), k)),
+        ("heapq.nlargest", lambda: heapq.nlargest(k, data)),
+    ]
+
+    print(f"{'Method':<22} {'Seconds':<10}")
+    print("-" * 32)
+    for name, run in cases:
+        start_time = time.perf_counter()
+        run()
+        print(f"{name:<22} {time.perf_counter() - start_time:<10.4f}")
+
+
+print("200,000 random floats, k=100:")
+benchmark_selection(size=200_000, k=100)
+
+print("\n8.11 LCS: Full Table vs Linear Space vs Bit-Parallel")
+print("-" * 30)
+
+
+def benchmark_lcs(
+    sizes=(1_000, 10_000, 100_000), table_limit=2_000, hirschberg_limit=10_000
+):
+    """Time and peak memory of the LCS variants on random text of each size"""
+    rng = random.Random(42)
+    alphabet = "abcdefghij \n"
+
+    print(f"{'Length':<8} {'Method':<14} {'Seconds':<10} {'Peak KiB':<10}")
+    print("-" * 44)
+    for size in sizes:
+        text1 = "".join(rng.choice(alphabet) for _ in range(size))
+        text2 = "".join(rng.choice(alphabet) for _ in range(size))
+        methods = [("bit-parallel", lcs_length_bitparallel)]
+        if size <= hirschberg_limit:
+            methods.insert(0, ("hirschberg", lcs_hirschberg))
+        if size <= table_limit:
+            methods.insert(0, ("full table", longest_common_subsequence))
+
+        for name, method in methods:
+            start_time = time.perf_counter()
+            method(text1, text2)
+            elapsed = time.perf_counter() - start_time
+
+            tracemalloc.start()
+            method(text1, text2)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{size:<8} {name:<14} {elapsed:<10.4f} {peak / 1024:<10.1f}")
+
+
+benchmark_lcs(sizes=[500, 20_000])
+
+print("\n8.12 Knapsack: 2-D Table vs Rolling Row vs NumPy")
+print("-" * 30)
+
+
+def benchmark_knapsack(num_items=10_000, capacity=1_000_000, table_limit=10**7):
+    """Time knapsack variants; pure-Python ones are skipped above `table_limit` cells"""
+    rng = random.Random(42)
+    weights = [rng.randint(1, capacity // 10 or 1) for _ in range(num_items)]
+    values = [rng.randint(1, 1000) for _ in range(num_items)]
+    cells = num_items * (capacity + 1)
+
+    cases = []
+    if cells <= table_limit:
+        cases.append(("2-D table", lambda: knapsack(weights, values, capacity)))
+        cases.append(
+            (
+                "rolling row",
+                lambda: knapsack_optimized(weights, values, capacity, use_numpy=False),
+            )
+        )
+        cases.append(
+            (
+                "rolling + items",
+                lambda: knapsack_optimized(
+                    weights, values, capacity, use_numpy=False, return_items=True
+                ),
+            )
+        )
+    if HAS_NUMPY:
+        cases.append(
+            (
+                "numpy",
+                lambda: knapsack_optimized(weights, values, capacity, use_numpy=True),
+            )
+        )
+        cases.append(
+            (
+                "numpy + items",
+                lambda: knapsack_optimized(
+                    weights, values, capacity, use_numpy=True, return_items=True
+                ),
+            )
+        )
+
+    print(f"{'Method':<18} {'Seconds':<10} {'Peak KiB':<10}")
+    print("-" * 38)
+    for name, run in cases:
+        start_time = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start_time
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<18} {elapsed:<10.4f} {peak / 1024:<10.1f}")
+
+
+print("50 items, capacity 5,000:")
+benchmark_knapsack(num_items=50, capacity=5_000)
+
+print("\n8.13 Coin Change: Per-Call DP vs Shared Solver")
+print("-" * 30)
+
+
+def benchmark_coin_change(num_queries=10_000, max_amount=10_000):
+    """Answer many queries for one coin set with coin_change() vs CoinChangeSolver"""
+    rng = random.Random(42)
+    coins = [1, 5, 10, 25, 50, 100]
+    amounts = [rng.randint(0, max_amount) for _ in range(num_queries)]
+
+    start_time = time.perf_counter()
+    expected = [coin_change(coins, amount) for amount in amounts]
+    per_call_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    solver = CoinChangeSolver(coins)
+    answers = [solver.min_coins(amount) for amount in amounts]
+    solver_time = time.perf_counter() - start_time
+
+    print(f"{'Method':<20} {'Seconds':<10} {'Queries/s':<12}")
+    print("-" * 42)
+    print(
+        f"{'coin_change()':<20} {per_call_time:<10.4f} {num_queries / per_call_time:<12,.0f}"
+    )
+    print(
+        f"{'CoinChangeSolver':<20} {solver_time:<10.4f} {num_queries / solver_time:<12,.0f}"
+    )
+    print(f"Same answers: {answers == expected}")
+
+
+print("200 queries up to amount 2,000:")
+benchmark_coin_change(num_queries=200, max_amount=2_000)
+
+print("\n8.14 Huffman Codec vs zlib Throughput")
+print("-" * 30)
+
+import zlib
+
+
+def _zlib_compress_file(input_path, output_path, chunk_size=1 << 20):
+    compressor = zlib.compressobj(6)
+    with open(input_path, "rb") as source, open(output_path, "wb") as target:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            target.write(compressor.compress(chunk))
+        target.write(compressor.flush())
+        return target.tell()
+
+
+def _zlib_decompress_file(input_path, output_path, chunk_size=1 << 20):
+    decompressor = zlib.decompressobj()
+    with open(input_path, "rb") as source, open(output_path, "wb") as target:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            target.write(decompressor.decompress(chunk))
+        target.write(decompressor.flush())
+
+
+def benchmark_huffman(size_mb=64):
+    """Compress and decompress the same files with the Huffman codec and zlib"""
+    rng = random.Random(42)
+    words = ["the", "graph", "node", "edge", "sort", "search", "heap", "tree", "cache"]
+    work_dir = tempfile.mkdtemp()
+    inputs = {
+        "text": os.path.join(work_dir, "text.bin"),
+        "skewed bytes": os.path.join(work_dir, "skewed.bin"),
+    }
+    size = int(size_mb * (1 << 20))
+    with open(inputs["text"], "w", encoding="ascii") as text_file:
+        written = 0
+        while written < size:
+            line = " ".join(rng.choices(words, k=12)) + "\n"
+            text_file.write(line)
+            written += len(line)
+    with open(inputs["skewed bytes"], "wb") as skewed_file:
+        weights = [1 / (rank + 1) for rank in range(256)]
+        for offset in range(0, size, 1 << 20):
+            block = min(1 << 20, size - offset)
+            skewed_file.write(bytes(rng.choices(range(256), weights, k=block)))
+
+    codecs = [
+        ("Huffman", huffman_compress_file, huffman_decompress_file),
+        ("zlib", _zlib_compress_file, _zlib_decompress_file),
+    ]
+    packed_path = os.path.join(work_dir, "packed")
+    unpacked_path = os.path.join(work_dir, "unpacked")
+    print(
+        f"{'Input':<14} {'Codec':<9} {'Ratio':<7} {'Comp MB/s':<10} {'Decomp MB/s':<12}"
+    )
+    print("-" * 54)
+    try:
+        for input_name, input_path in inputs.items():
+            original_size = os.path.getsize(input_path)
+            megabytes = original_size / (1 << 20)
+            for codec_name, compress, decompress in codecs:
+                start_time = time.perf_counter()
+                compress(input_path, packed_path)
+                compress_time = time.perf_counter() - start_time
+                start_time = time.perf_counter()
+                decompress(packed_path, unpacked_path)
+                decompress_time = time.perf_counter() - start_time
+                ratio = os.path.getsize(packed_path) / original_size
+                print(
+                    f"{input_name:<14} {codec_name:<9} {ratio:<7.3f} "
+                    f"{megabytes / compress_time:<10.1f} {megabytes / decompress_time:<12.1f}"
+                )
+    finally:
+        for file_name in os.listdir(work_dir):
+            os.remove(os.path.join(work_dir, file_name))
+        os.rmdir(work_dir)
+
+
+print("1 MB inputs:")
+benchmark_huffman(size_mb=1)
+
+print("\n8.15 Interval Scheduling at Scale")
+print("-" * 30)
+
+
+def benchmark_interval_scheduling(num_jobs=10_000_000):
+    """Sort-once weighted DP vs greedy scheduling on random batch jobs"""
+    rng = random.Random(42)
+    horizon = 86_400
+    job_start = [rng.randrange(horizon) for _ in range(num_jobs)]
+    job_finish = [begin + rng.randint(1, 3_600) for begin in job_start]
+    job_weight = [rng.randint(1, 100) for _ in range(num_jobs)]
+
+    start_time = time.perf_counter()
+    order = sorted(range(num_jobs), key=lambda i: (job_finish[i], job_start[i]))
+    greedy = activity_selection(
+        [job_start[i] for i in order], [job_finish[i] for i in order]
+    )
+    greedy_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    streamed = sum(
+        1
+        for _ in stream_activity_selection(
+            sorted(zip(job_start, job_finish), key=lambda pair: (pair[1], pair[0]))
+        )
+    )
+    stream_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    total_weight, chosen = weighted_interval_scheduling(
+        job_start, job_finish, job_weight
+    )
+    weighted_time = time.perf_counter() - start_time
+
+    print(f"{'Method':<26} {'Seconds':<10} {'Jobs/s':<12} {'Selected':<10}")
+    print("-" * 58)
+    print(
+        f"{'sort + activity_selection':<26} {greedy_time:<10.4f} "
+        f"{num_jobs / greedy_time:<12,.0f} {len(greedy):<10}"
+    )
+    print(
+        f"{'stream_activity_selection':<26} {stream_time:<10.4f} "
+        f"{num_jobs / stream_time:<12,.0f} {streamed:<10}"
+    )
+    print(
+        f"{'weighted (DP + bisect)':<26} {weighted_time:<10.4f} "
+        f"{num_jobs / weighted_time:<12,.0f} {len(chosen):<10}"
+    )
+    print(f"Weighted schedule total weight: {total_weight:,}")
+
+
+print("20,000 jobs:")
+benchmark_interval_scheduling(num_jobs=20_000)
+
+print("\n8.16 Connected Components: Repeated BFS vs Union-Find")
+print("-" * 30)
+
+
+def bfs_components_per_vertex(graph):
+    """Label components by running a full BFS from every vertex, O(V * (V + E))"""
+    component_of = {}
+    for vertex in graph:
+        reached = frozenset(iter_bfs(graph, vertex))
+        component_of[vertex] = min(reached)
+    return len(set(component_of.values()))
+
+
+def bfs_components(graph):
+    """Label components with one BFS per unlabelled vertex, O(V + E)"""
+    seen = set()
+    count = 0
+    for vertex in graph:
+        if vertex not in seen:
+            seen.update(iter_bfs(graph, vertex))
+            count += 1
+    return count
+
+
+def benchmark_connected_components(num_vertices=1_000_000, naive_limit=2_000):
+    """Count components of a sparse random graph with several methods"""
+    rng = random.Random(42)
+    edges = [
+        (rng.randrange(num_vertices), rng.randrange(num_vertices))
+        for _ in range(num_vertices * 3 // 4)
+    ]
+    graph = {vertex: [] for vertex in range(num_vertices)}
+    for u, v in edges:
+        graph[u].append(v)
+        graph[v].append(u)
+    csr = CSRGraph.from_dict(graph)
+
+    def count_from_stream(edge_stream):
+        # Vertices that never appear in an edge are singleton components
+        disjoint_set = DisjointSet.from_graph(edge_stream)
+        return disjoint_set.num_sets + num_vertices - len(disjoint_set)
+
+    cases = [
+        ("BFS per unlabelled vertex", lambda: bfs_components(graph)),
+        ("Union-find (dict graph)", lambda: DisjointSet.from_graph(graph).num_sets),
+        ("Union-find (CSR graph)", lambda: DisjointSet.from_graph(csr).num_sets),
+        ("Union-find (edge stream)", lambda: count_from_stream(iter(edges))),
+    ]
+    if num_vertices <= naive_limit:
+        cases.insert(
+            0, ("BFS from every vertex", lambda: bfs_components_per_vertex(graph))
+        )
+
+    print(f"{'Method':<28} {'Seconds':<10} {'Components':<12}")
+    print("-" * 50)
+    for name, run in cases:
+        start_time = time.perf_counter()
+        components = run()
+        elapsed = time.perf_counter() - start_time
+        print(f"{name:<28} {elapsed:<10.4f} {components:<12,}")
+
+
+print("2,000 vertices:")
+benchmark_connected_components(num_vertices=2_000)
+
+print("\n8.17 Point-to-Point Queries: Dijkstra vs A* vs ALT")
+print("-" * 30)
+
+
+def benchmark_point_to_point(side=300, num_queries=1_000, num_landmarks=8):
+    """Random queries on a grid road graph with and without precomputed landmarks"""
+    rng = random.Random(7)
+    road_graph = grid_road_graph(side)
+    vertices = list(road_graph)
+    queries = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_queries)]
+
+    start_time = time.perf_counter()
+    landmark_heuristic = LandmarkHeuristic(road_graph, num_landmarks=num_landmarks)
+    preprocessing_time = time.perf_counter() - start_time
+    print(
+        f"ALT preprocessing: {preprocessing_time:.3f}s for {num_landmarks} landmarks, "
+        f"{landmark_heuristic.memory_bytes() / 1024:.1f} KiB of tables"
+    )
+
+    cases = [
+        (
+            "Dijkstra (early exit)",
+            lambda s, t: dijkstra_heap(road_graph, s, target=t)[0],
+        ),
+        ("A* (Manhattan)", lambda s, t: astar(road_graph, s, t, manhattan)[0]),
+        ("A* (ALT)", lambda s, t: astar(road_graph, s, t, landmark_heuristic)[0]),
+    ]
+    print(f"{'Method':<22} {'ms/query':<10} {'Settled':<10} {'Same answers':<12}")
+    print("-" * 56)
+    expected = None
+    for name, query in cases:
+        settled = 0
+        answers = []
+        start_time = time.perf_counter()
+        for source, target in queries:
+            distances = query(source, target)
+            settled += len(distances)
+            answers.append(distances[target])
+        elapsed = time.perf_counter() - start_time
+        if expected is None:
+            expected = answers
+        print(
+            f"{name:<22} {elapsed * 1000 / num_queries:<10.3f} "
+            f"{settled // num_queries:<10,} {answers == expected}"
+        )
+
+
+print("30 x 30 grid, 50 queries:")
+benchmark_point_to_point(side=30, num_queries=50, num_landmarks=4)
+
+print("\n8.18 Parallel BFS Scaling")
+print("-" * 30)
+
+
+def benchmark_parallel_bfs(
+    num_vertices=5_000_000, num_edges=50_000_000, worker_counts=(1, 2, 4, 8, 16)
+):
+    """Serial deque BFS vs level-synchronous BFS at several worker counts"""
+    rng = random.Random(42)
+    graph = CSRGraph(
+        (
+            (rng.randrange(num_vertices), rng.randrange(num_vertices))
+            for _ in range(num_edges)
+        ),
+        vertices=range(num_vertices),
+    )
+    start = 0
+
+    print(f"{'Method':<24} {'Seconds':<10} {'Edges/s':<14} {'Levels':<8}")
+    print("-" * 56)
+    start_time = time.perf_counter()
+    reached = sum(1 for _ in iter_bfs(graph, start))
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"{'iter_bfs (deque)':<24} {elapsed:<10.4f} {num_edges / elapsed:<14,.0f} {'-':<8}"
+    )
+
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        frontiers, _ = parallel_bfs(graph, start, workers=workers)
+        elapsed = time.perf_counter() - start_time
+        assert sum(len(frontier) for frontier in frontiers) == reached
+        print(
+            f"{f'level-sync ({workers} workers)':<24} {elapsed:<10.4f} "
+            f"{num_edges / elapsed:<14,.0f} {len(frontiers):<8}"
+        )
+
+
+if __name__ == "__main__":
+    print(f"50,000 vertices, 500,000 edges on {os.cpu_count()} CPU(s):")
+    benchmark_parallel_bfs(
+        num_vertices=50_000, num_edges=500_000, worker_counts=(1, 2, 4)
+    )
+
+print("\n8.19 Tower of Hanoi: Printing vs Generator vs Packed Export")
+print("-" * 30)
+
+
+def benchmark_hanoi(n=30, generator_disks=22):
+    """Moves per second for the recursive printer, the generator and packed bytes"""
+    moves = (1 << generator_disks) - 1
+    print(f"{'Method':<30} {'Moves':<16} {'Seconds':<10} {'Moves/s':<14}")
+    print("-" * 72)
+
+    start_time = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        tower_of_hanoi(generator_disks, "A", "B", "C")
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"{'tower_of_hanoi (printing)':<30} {moves:<16,} {elapsed:<10.4f} {moves / elapsed:<14,.0f}"
+    )
+
+    start_time = time.perf_counter()
+    for _ in hanoi_moves(generator_disks):
+        pass
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"{'hanoi_moves (generator)':<30} {moves:<16,} {elapsed:<10.4f} {moves / elapsed:<14,.0f}"
+    )
+
+    moves = (1 << n) - 1
+    start_time = time.perf_counter()
+    packed_bytes = sum(len(chunk) for chunk in pack_hanoi_moves(n))
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"{f'pack_hanoi_moves ({n} disks)':<30} {moves:<16,} {elapsed:<10.4f} {moves / elapsed:<14,.0f}"
+    )
+    print(
+        f"Packed size: {packed_bytes / (1 << 20):,.1f} MiB, streamed in chunks of up to 1 MiB"
+    )
+
+
+print("Printer/generator with 14 disks, packed export with 24 disks:")
+benchmark_hanoi(n=24, generator_disks=14)
+
+print("\n8.20 Tree Layouts: Memory and Traversal Speed")
+print("-" * 30)
+
+
+def build_complete_tree(num_nodes, node_class=TreeNode):
+    """Complete binary tree in heap order: node i has children 2i + 1 and 2i + 2"""
+    nodes = [node_class(val) for val in range(num_nodes)]
+    for index in range(num_nodes // 2):
+        child = 2 * index + 1
+        nodes[index].left = nodes[child]
+        if child + 1 < num_nodes:
+            nodes[index].right = nodes[child + 1]
+    return nodes[0] if nodes else None
+
+
+def build_complete_array_tree(num_nodes):
+    """The same complete tree as three array columns"""
+    tree = ArrayTree()
+    for index in range(num_nodes):
+        left = 2 * index + 1
+        tree.add_node(
+            index,
+            left if left < num_nodes else -1,
+            left + 1 if left + 1 < num_nodes else -1,
+        )
+    return tree
+
+
+def benchmark_tree_layouts(num_nodes=10_000_000):
+    """Memory per node and inorder traversal time for each tree layout"""
+    layouts = [
+        ("TreeNode", lambda: build_complete_tree(num_nodes)),
+        ("SlotsTreeNode", lambda: build_complete_tree(num_nodes, SlotsTreeNode)),
+        ("ArrayTree", lambda: build_complete_array_tree(num_nodes)),
+    ]
+    print(f"{'Layout':<16} {'Bytes/node':<12} {'Build (s)':<11} {'Inorder (s)':<12}")
+    print("-" * 51)
+    for name, build in layouts:
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        tree = build()
+        build_time = time.perf_counter() - start_time
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start_time = time.perf_counter()
+        total = sum(iter_inorder(tree))
+        traversal_time = time.perf_counter() - start_time
+        assert total == num_nodes * (num_nodes - 1) // 2
+        print(
+            f"{name:<16} {current / num_nodes:<12.1f} {build_time:<11.4f} {traversal_time:<12.4f}"
+        )
+        del tree
+
+
+print("100,000 nodes (bytes include the int values; build time is under tracemalloc):")
+benchmark_tree_layouts(num_nodes=100_000)
+
+print("\n8.21 Fuzzy Matching: Full DP vs Band Cutoff vs Prefiltered")
+print("-" * 30)
+
+
+def benchmark_fuzzy_matching(num_candidates=1_000_000, num_queries=10, k=2):
+    """Match queries against random names with increasingly aggressive pruning"""
+    rng = random.Random(42)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    candidates = [
+        "".join(rng.choices(letters, k=rng.randint(5, 15)))
+        for _ in range(num_candidates)
+    ]
+    queries = []
+    for _ in range(num_queries):
+        query = list(rng.choice(candidates))
+        # One substitution, so each query has at least one match within k
+        query[rng.randrange(len(query))] = rng.choice(letters)
+        queries.append("".join(query))
+
+    cases = [
+        (
+            "levenshtein (full DP)",
+            lambda query: sorted(
+                (score, name)
+                for name in candidates
+                for score in (levenshtein(query, name),)
+                if score <= k
+            ),
+        ),
+        (
+            "levenshtein (band k)",
+            lambda query: sorted(
+                (score, name)
+                for name in candidates
+                for score in (levenshtein(query, name, k),)
+                if score <= k
+            ),
+        ),
+        ("best_matches", lambda query: best_matches(query, candidates, k)),
+    ]
+    print(f"{'Method':<24} {'ms/query':<12} {'Matches':<10}")
+    print("-" * 46)
+    expected = None
+    for name, match in cases:
+        start_time = time.perf_counter()
+        results = [match(query) for query in queries]
+        elapsed = time.perf_counter() - start_time
+        expected = expected or results
+        assert results == expected
+        total = sum(len(result) for result in results)
+        print(f"{name:<24} {elapsed * 1000 / num_queries:<12.2f} {total:<10}")
+
+
+print("5,000 candidates, 5 queries, k = 2:")
+benchmark_fuzzy_matching(num_candidates=5_000, num_queries=5)
+
 # ============================================
 # SUMMARY
 # ============================================
@@ -850,6 +5218,8 @@ print(
    - Linear Search: O(n) - Simple but slow for large datasets
    - Binary Search: O(log n) - Fast but requires sorted data
    - Recursive Binary Search: O(log n) - Elegant recursive approach
+   - Batched Binary Search: Many queries per call, lower/upper bounds
+   - SortedList: Blocked sorted container with fast inserts and rank queries
 
 2. SORTING ALGORITHMS
    - Bubble Sort: O(n²) - Simple but inefficient
@@ -857,28 +5227,51 @@ print(
    - Insertion Sort: O(n²) - Good for small datasets
    - Merge Sort: O(n log n) - Stable and predictable
    - Quick Sort: O(n log n) - Fast in practice
+   - Introsort: In-place quick sort with a heapsort worst-case guard
+   - Counting/Radix Sort: O(n + k) stable integer sorts with optional NumPy
+   - External Merge Sort: Sorted runs on disk + k-way heap merge
+   - Parallel Merge Sort: Shared-memory chunks sorted and merged as p output slices in parallel
+   - Selection: Introselect for the k-th element, streaming heap top-k
 
 3. RECURSIVE ALGORITHMS
    - Factorial: Simple recursion example
    - Fibonacci: Classic recursion with memoization
+   - Fast Doubling Fibonacci: O(log n) with a bounded, instrumented cache
    - Tower of Hanoi: Complex recursive problem
+   - Hanoi Move Generator: Binary-counter moves, random access and packed export
    - Tree Traversals: Inorder, preorder, postorder
+   - Compact Trees: __slots__ nodes and a structure-of-arrays ArrayTree
+   - Iterative Traversals: Explicit-stack generators for deep trees
 
 4. DYNAMIC PROGRAMMING
    - Longest Common Subsequence: String matching
+   - Hirschberg / Bit-Parallel LCS: Linear space and word-parallel variants
    - Knapsack Problem: Optimization problem
+   - Rolling/NumPy Knapsack: O(W) memory with bitset item recovery
    - Coin Change: Minimum coins problem
+   - Coin Change Solver: One shared, lazily grown table for many queries
+   - Edit Distance: Banded Levenshtein/Damerau with q-gram prefiltered matching
    - Memoization: Caching recursive results
+   - Reusable Memoization: LRU/TTL caches with statistics (cache_utils)
 
 5. GREEDY ALGORITHMS
    - Activity Selection: Scheduling problems
    - Huffman Coding: Data compression
+   - Streaming Huffman Codec: Canonical codes, packed bitstream, table-driven decoding
+   - Weighted Interval Scheduling: Sort once, DP + binary search, streaming greedy
    - Always choose locally optimal solution
 
 6. GRAPH ALGORITHMS
    - DFS: Depth-first traversal
    - BFS: Breadth-first traversal
    - Dijkstra: Shortest path algorithm
+   - Heap Dijkstra: O((V + E) log V) with early exit and path reconstruction
+   - CSR Graph: Compact array-backed adjacency with integer vertex ids
+   - CSR BFS/Dijkstra: Traversals on vertex ids straight over the CSR arrays
+   - Iterative DFS/BFS: Generators that stream visit order without printing
+   - Union-Find: Array-backed disjoint sets for incremental connected components
+   - A*/ALT: Goal-directed search with precomputed landmark distance bounds
+   - Parallel BFS: Level-synchronous frontiers over shared-memory CSR arrays
 
 7. PERFORMANCE ANALYSIS
    - Time complexity measurement
@@ -534,16 +534,24 @@ print("=" * 60)
 print("\n6.1 Performance Comparison")
 print("-" * 30)
 
-import time
+import os
+import sys
+
+# The shared benchmark runner lives with the utility modules of the packages chapter
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "03_Packages_Modules_Libraries_Tools",
+        "Examples",
+    )
+)
+from bench_utils import run_benchmark
 
 
-def measure_time(func, iterations=1000):
-    """Measure execution time of a function"""
-    start_time = time.time()
-    for _ in range(iterations):
-        func()
-    end_time = time.time()
-    return (end_time - start_time) / iterations
+def measure_time(func):
+    """Median seconds per call, after warmup and with the GC paused"""
+    return run_benchmark(func).median
 
 
 # Test data
@@ -583,7 +591,7 @@ def test_for_loop_filter():
     return result
 
 
-print("Performance comparison (seconds per operation):")
+print("Performance comparison (median seconds per operation):")
 print("Map operations:")
 print(f"  Map function: {measure_time(test_map_performance):.6f}")
 print(f"  List comprehension: {measure_time(test_list_comprehension):.6f}")
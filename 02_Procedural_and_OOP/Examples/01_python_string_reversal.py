@@ -469,9 +469,22 @@ print("=" * 60)
 print("\n6.1 Time Complexity Comparison")
 print("-" * 30)
 
-import time
+import os
 import random
 import string
+import sys
+
+# The shared benchmark runner lives with the utility modules of the packages chapter
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "03_Packages_Modules_Libraries_Tools",
+        "Examples",
+    )
+)
+from bench_utils import run_benchmark
 
 
 def generate_random_string(length):
@@ -479,13 +492,9 @@ def generate_random_string(length):
     return "".join(random.choices(string.ascii_letters + string.digits, k=length))
 
 
-def measure_time(func, text, iterations=1000):
-    """Measure execution time of a function"""
-    start_time = time.time()
-    for _ in range(iterations):
-        func(text)
-    end_time = time.time()
-    return (end_time - start_time) / iterations
+def measure_time(func, text):
+    """Median seconds per call, after warmup and with the GC paused"""
+    return run_benchmark(func, text).median
 
 
 # Test different string lengths
@@ -500,11 +509,11 @@ methods = [
     ("Stack", reverse_string_stack),
 ]
 
-print("Performance comparison (seconds per operation):")
+print("Performance comparison (median seconds per operation):")
 print(
-    f"{'Length':<8} {'Slicing':<10} {'Reversed':<10} {'Loop':<10} {'List':<10} {'Two-Pointer':<12} {'Stack':<10}"
+    f"{'Length':<8} {'Slicing':<10} {'Reversed':<10} {'Loop':<10} {'List':<10} {'Recursive':<10} {'Two-Pointer':<12} {'Stack':<10}"
 )
-print("-" * 80)
+print("-" * 91)
 
 for length in string_lengths:
     test_string = generate_random_string(length)
@@ -512,17 +521,15 @@ for length in string_lengths:
 
     for name, method in methods:
         if (
-            length <= 1000 or name != "Recursive"
-        ):  # Skip recursive for very long strings
-            time_taken = measure_time(
-                method, test_string, 100 if length > 1000 else 1000
-            )
+            length < 1000 or name != "Recursive"
+        ):  # Skip recursive where it would exceed the recursion limit
+            time_taken = measure_time(method, test_string)
             times.append(f"{time_taken:.8f}")
         else:
             times.append("N/A")
 
     print(
-        f"{length:<8} {times[0]:<10} {times[1]:<10} {times[2]:<10} {times[3]:<10} {times[4]:<12} {times[5]:<10}"
+        f"{length:<8} {times[0]:<10} {times[1]:<10} {times[2]:<10} {times[3]:<10} {times[4]:<10} {times[5]:<12} {times[6]:<10}"
     )
 
 print("\n6.2 Memory Usage Analysis")
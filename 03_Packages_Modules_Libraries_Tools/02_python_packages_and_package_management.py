@@ -691,6 +691,23 @@ config = Config()
 
 create_advanced_package()
 
+print("\n--- Using cache settings from Config ---")
+try:
+    # cache_enabled and max_cache_size drive the memoization layer
+    from advanced_package.config import config
+    from cache_utils import memoize_from_config
+
+    import my_math_package
+
+    cached_factorial = memoize_from_config(config)(my_math_package.factorial)
+    for n in [10, 20, 10, 20, 30]:
+        cached_factorial(n)
+    print(f"Cache enabled: {config.get('cache_enabled')}")
+    print(f"Max cache size: {config.get('max_cache_size')}")
+    print(f"Cached factorial stats: {cached_factorial.cache_stats()}")
+except ImportError as e:
+    print(f"Import error: {e}")
+
 # 11. PACKAGE TESTING
 print("\n" + "=" * 60)
 print("11. PACKAGE TESTING")
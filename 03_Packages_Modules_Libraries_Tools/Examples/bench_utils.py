@@ -0,0 +1,401 @@
+"""
+Benchmark Utilities Module
+=========================
+
+A shared benchmark runner built on time.perf_counter_ns: warmup calls,
+automatic iteration calibration, median/p95/stddev statistics, garbage
+collector control, optional process isolation and JSON baselines so a run
+can be compared with a saved one and regressions flagged.
+"""
+
+import gc
+import json
+import math
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+ResultsLike = Union[Iterable["BenchmarkResult"], Dict[str, Dict[str, Any]]]
+
+
+class BenchmarkResult:
+    """Per-call timings of one benchmark, in seconds."""
+
+    def __init__(self, name: str, samples: List[float], iterations: int) -> None:
+        self.name = name
+        self.samples = samples
+        self.iterations = iterations
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def p95(self) -> float:
+        # Nearest-rank percentile, so the value is always an observed sample
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    @property
+    def minimum(self) -> float:
+        return min(self.samples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the summary statistics and raw samples as a dictionary.
+
+        Returns:
+            Dictionary with median, mean, p95, stdev, min, iterations and samples
+        """
+        return {
+            "median": self.median,
+            "mean": self.mean,
+            "p95": self.p95,
+            "stdev": self.stdev,
+            "min": self.minimum,
+            "iterations": self.iterations,
+            "samples": self.samples,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BenchmarkResult({self.name!r}, median={self.median:.3e}s, "
+            f"p95={self.p95:.3e}s, stdev={self.stdev:.3e}s)"
+        )
+
+
+def _time_calls(
+    func: Callable, args: Tuple, setup: Optional[Callable], iterations: int
+) -> int:
+    """Nanoseconds spent in `iterations` calls; setup() runs outside the timer."""
+    if setup is None:
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            func(*args)
+        return time.perf_counter_ns() - start
+
+    elapsed = 0
+    for _ in range(iterations):
+        call_args = setup()
+        start = time.perf_counter_ns()
+        func(*call_args)
+        elapsed += time.perf_counter_ns() - start
+    return elapsed
+
+
+def _calibrate(
+    func: Callable,
+    args: Tuple,
+    setup: Optional[Callable],
+    min_time: float,
+    max_iterations: int,
+) -> int:
+    """Double the iteration count until one sample lasts at least `min_time`."""
+    target_ns = min_time * 1e9
+    iterations = 1
+    while iterations < max_iterations:
+        elapsed = _time_calls(func, args, setup, iterations)
+        if elapsed >= target_ns:
+            break
+        # Jump straight to the estimate when the batch was long enough to trust
+        if elapsed > target_ns / 100:
+            iterations = min(
+                max_iterations, math.ceil(iterations * target_ns / elapsed)
+            )
+            break
+        iterations *= 2
+    return min(iterations, max_iterations)
+
+
+def _process_context() -> Any:
+    """Prefer fork so the child inherits the function without pickling it."""
+    sys.stdout.flush()
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _run_in_child(connection: Any, func: Callable, args: Tuple, options: Dict) -> None:
+    try:
+        result = run_benchmark(func, *args, **options)
+        connection.send(("ok", result.name, result.samples, result.iterations))
+    except BaseException as error:  # Report any failure to the parent
+        connection.send(("error", repr(error)))
+    finally:
+        connection.close()
+
+
+def run_benchmark(
+    func: Callable,
+    *args: Any,
+    name: Optional[str] = None,
+    setup: Optional[Callable[[], Tuple]] = None,
+    repeat: int = 15,
+    warmup: int = 1,
+    min_time: float = 0.005,
+    iterations: Optional[int] = None,
+    max_iterations: int = 1_000_000,
+    disable_gc: bool = True,
+    isolate: bool = False,
+) -> BenchmarkResult:
+    """
+    Time func(*args) and summarize the per-call cost.
+
+    Each of the `repeat` samples runs the function enough times to last at
+    least `min_time` seconds, after `warmup` untimed samples.
+
+    Args:
+        func: The function to time
+        *args: Arguments passed to every call
+        name: Label for reports and JSON files (default: the function name)
+        setup: Callable returning a fresh argument tuple before each call,
+            for functions that mutate their input; its cost is not timed
+        repeat: Number of timed samples
+        warmup: Number of untimed samples run first
+        min_time: Minimum seconds per sample used to calibrate iterations
+        iterations: Fixed calls per sample (skips calibration)
+        max_iterations: Upper bound for calibrated iterations
+        disable_gc: Collect garbage first, then keep the collector off while timing
+        isolate: Run the whole benchmark in a fresh child process
+
+    Returns:
+        A BenchmarkResult with one per-call time per sample
+
+    Examples:
+        >>> result = run_benchmark(sorted, [3, 1, 2], repeat=5)
+        >>> result.name, len(result.samples)
+        ('sorted', 5)
+    """
+    name = name or getattr(func, "__name__", "benchmark")
+    if isolate:
+        options = {
+            "name": name,
+            "setup": setup,
+            "repeat": repeat,
+            "warmup": warmup,
+            "min_time": min_time,
+            "iterations": iterations,
+            "max_iterations": max_iterations,
+            "disable_gc": disable_gc,
+        }
+        context = _process_context()
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_in_child, args=(sender, func, args, options)
+        )
+        process.start()
+        sender.close()
+        try:
+            message = receiver.recv()
+        except EOFError:
+            message = ("error", f"exit code {process.exitcode}")
+        process.join()
+        if message[0] != "ok":
+            raise RuntimeError(
+                f"Benchmark {name!r} failed in child process: {message[1]}"
+            )
+        return BenchmarkResult(message[1], message[2], message[3])
+
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        if iterations is None:
+            iterations = _calibrate(func, args, setup, min_time, max_iterations)
+        for _ in range(warmup):
+            _time_calls(func, args, setup, iterations)
+        samples = [
+            _time_calls(func, args, setup, iterations) / iterations / 1e9
+            for _ in range(repeat)
+        ]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return BenchmarkResult(name, samples, iterations)
+
+
+def _as_dicts(results: ResultsLike) -> Dict[str, Dict[str, Any]]:
+    if isinstance(results, dict):
+        return results
+    return {result.name: result.to_dict() for result in results}
+
+
+def save_results(results: ResultsLike, path: str) -> None:
+    """
+    Write results to a JSON file together with basic machine information.
+
+    Args:
+        results: BenchmarkResult objects, or a dict as returned by load_results
+        path: Destination file
+    """
+    document = {
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": _as_dicts(results),
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read results written by save_results.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        Dictionary mapping benchmark names to their statistics
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def compare_results(
+    current: ResultsLike, baseline: ResultsLike, threshold: float = 0.10
+) -> List[Dict[str, Any]]:
+    """
+    Compare median times with a baseline and flag regressions.
+
+    A benchmark regresses when its median is more than `threshold` slower
+    than the baseline median and the two runs' median-to-p95 ranges do not
+    overlap, so a single noisy run is not reported as a slowdown.
+
+    Args:
+        current: Results of this run
+        baseline: Saved results, e.g. from load_results
+        threshold: Relative change treated as significant (0.10 = 10%)
+
+    Returns:
+        One dict per current benchmark with name, baseline, current,
+        change (relative) and status: "regression", "improvement",
+        "unchanged" or "new". A baseline median of 0.0 (below timer
+        resolution) has no relative change: the status is "unchanged" if
+        the current median is also 0.0 and "new" otherwise
+
+    Examples:
+        >>> old = {"f": {"median": 1.0, "p95": 1.1}}
+        >>> new = {"f": {"median": 2.0, "p95": 2.1}}
+        >>> compare_results(new, old)[0]["status"]
+        'regression'
+    """
+    current = _as_dicts(current)
+    baseline = _as_dicts(baseline)
+    comparisons = []
+    for name, stats in current.items():
+        old = baseline.get(name)
+        if old is None:
+            comparisons.append(
+                {
+                    "name": name,
+                    "baseline": None,
+                    "current": stats["median"],
+                    "change": None,
+                    "status": "new",
+                }
+            )
+            continue
+        if not old["median"]:
+            comparisons.append(
+                {
+                    "name": name,
+                    "baseline": old["median"],
+                    "current": stats["median"],
+                    "change": None,
+                    "status": "new" if stats["median"] else "unchanged",
+                }
+            )
+            continue
+        change = (stats["median"] - old["median"]) / old["median"]
+        status = "unchanged"
+        if change > threshold and stats["median"] > old.get("p95", old["median"]):
+            status = "regression"
+        elif change < -threshold and old["median"] > stats.get("p95", stats["median"]):
+            status = "improvement"
+        comparisons.append(
+            {
+                "name": name,
+                "baseline": old["median"],
+                "current": stats["median"],
+                "change": change,
+                "status": status,
+            }
+        )
+    return comparisons
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    # Test the functions
+    print("Testing benchmark utilities...")
+
+    # Test statistics on known samples
+    result = BenchmarkResult("fixed", [float(n) for n in range(1, 21)], 1)
+    assert result.median == 10.5
+    assert result.p95 == 19.0
+    assert result.minimum == 1.0
+    assert abs(result.stdev - statistics.stdev(range(1, 21))) < 1e-12
+
+    # Test calibration and warmup
+    result = run_benchmark(sum, range(1000), repeat=5, min_time=0.001)
+    assert len(result.samples) == 5
+    assert result.iterations > 1
+    assert all(sample > 0 for sample in result.samples)
+
+    # Test per-call setup for functions that mutate their input
+    data = list(range(500, 0, -1))
+    result = run_benchmark(
+        list.sort, name="sort", setup=lambda: (data.copy(),), repeat=3, iterations=10
+    )
+    assert data[0] == 500 and result.iterations == 10
+
+    # Test that the collector is restored
+    assert gc.isenabled()
+
+    # Test process isolation (a lambda works because the child is forked)
+    result = run_benchmark(
+        lambda: sum(range(100)), name="isolated", repeat=3, isolate=True
+    )
+    assert result.name == "isolated" and len(result.samples) == 3
+
+    # Test JSON round trip and baseline comparison
+    path = os.path.join(tempfile.mkdtemp(), "baseline.json")
+    baseline = [
+        BenchmarkResult("steady", [1.0] * 5, 1),
+        BenchmarkResult("slow", [1.0] * 5, 1),
+    ]
+    save_results(baseline, path)
+    loaded = load_results(path)
+    assert loaded["steady"]["median"] == 1.0
+    current = [
+        BenchmarkResult("steady", [1.02] * 5, 1),
+        BenchmarkResult("slow", [1.5] * 5, 1),
+        BenchmarkResult("added", [1.0] * 5, 1),
+    ]
+    statuses = {row["name"]: row["status"] for row in compare_results(current, loaded)}
+    assert statuses == {"steady": "unchanged", "slow": "regression", "added": "new"}
+    zero = {"instant": {"median": 0.0, "p95": 0.0}}
+    assert compare_results(zero, zero)[0]["status"] == "unchanged"
+    assert compare_results({"instant": {"median": 1e-6}}, zero)[0]["status"] == "new"
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+    print("All tests passed!")
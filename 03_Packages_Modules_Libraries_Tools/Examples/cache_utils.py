@@ -0,0 +1,572 @@
+"""
+Cache Utilities Module
+=====================
+
+A reusable memoization layer with LRU and TTL eviction, size limits,
+per-function statistics and an optional SQLite backend for caches that
+should survive restarts.
+"""
+
+import functools
+import hashlib
+import pickle
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+# Statistics for every memoized function, keyed by module.qualname
+_registry: Dict[str, "CacheStats"] = {}
+
+
+class CacheStats:
+    """Hit, miss, eviction and expiration counters for one cache."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the counters as a dictionary.
+
+        Returns:
+            Dictionary with hits, misses, evictions, expirations and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        return f"CacheStats({self.to_dict()})"
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory cache with LRU eviction, TTL and a byte budget.
+
+    Entries are evicted least-recently-used first whenever the cache holds
+    more than `max_size` entries or more than `max_bytes` estimated bytes.
+    Entries older than `ttl` seconds are treated as missing.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.stats = CacheStats()
+        self.total_bytes = 0
+        self._data: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key, counting a hit or a miss.
+
+        Args:
+            key: The cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value or `default`
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at and expires_at <= time.monotonic():
+                    self._remove(key)
+                    self.stats.expirations += 1
+                else:
+                    self._data.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+            self.stats.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting old entries if a limit is exceeded.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return  # Would evict everything else and still not fit
+            self._data[key] = (value, expires_at, nbytes)
+            self.total_bytes += nbytes
+
+            while (self.max_size is not None and len(self._data) > self.max_size) or (
+                self.max_bytes is not None and self.total_bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, nbytes = self._data.pop(key)
+        self.total_bytes -= nbytes
+
+    def clear(self) -> None:
+        """Remove every entry (statistics are kept)."""
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    Persistent cache stored in a SQLite database file.
+
+    Keys and values are pickled, so a warm cache survives process restarts.
+    Supports the same LRU, TTL and byte limits as LRUCache; sizes are the
+    pickled value lengths.
+
+    Hits do not write: access times are buffered and flushed in batches of
+    `touch_batch` (and before evicting or closing), and the row count and
+    byte total are tracked in memory, so one instance should own the table.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: Optional[int] = 10_000,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        table: str = "cache",
+        touch_batch: int = 256,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.table = table
+        self.touch_batch = touch_batch
+        self.stats = CacheStats()
+        self._touched: Dict[bytes, float] = {}
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key BLOB PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_last_access "
+                f"ON {table} (last_access)"
+            )
+        self._count, self.total_bytes = self._conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM {table}"
+        ).fetchone()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key, counting a hit or a miss.
+
+        Args:
+            key: The cache key (must be picklable)
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value or `default`
+        """
+        blob_key = pickle.dumps(key)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?",
+                (blob_key,),
+            ).fetchone()
+            if row is not None:
+                value, expires_at = row
+                if expires_at and expires_at <= now:
+                    with self._conn:
+                        self._delete(blob_key, len(value))
+                    self.stats.expirations += 1
+                else:
+                    self._touched[blob_key] = now
+                    if len(self._touched) >= self.touch_batch:
+                        self._flush_touches()
+                    self.stats.hits += 1
+                    return pickle.loads(value)
+            self.stats.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting least recently used rows if a limit is exceeded.
+
+        Args:
+            key: The cache key (must be picklable)
+            value: The value to cache (must be picklable)
+        """
+        blob_key = pickle.dumps(key)
+        blob_value = pickle.dumps(value)
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else 0.0
+        with self._lock, self._conn:
+            self._touched.pop(blob_key, None)
+            old = self._conn.execute(
+                f"SELECT LENGTH(value) FROM {self.table} WHERE key = ?", (blob_key,)
+            ).fetchone()
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+                (blob_key, blob_value, expires_at, now),
+            )
+            if old is None:
+                self._count += 1
+            else:
+                self.total_bytes -= old[0]
+            self.total_bytes += len(blob_value)
+            self._evict()
+
+    def _delete(self, blob_key: bytes, nbytes: int) -> None:
+        self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (blob_key,))
+        self._touched.pop(blob_key, None)
+        self._count -= 1
+        self.total_bytes -= nbytes
+
+    def _flush_touches(self) -> None:
+        """Write the buffered access times in one transaction."""
+        if not self._touched:
+            return
+        with self._conn:
+            self._conn.executemany(
+                f"UPDATE {self.table} SET last_access = ? WHERE key = ?",
+                [(when, blob_key) for blob_key, when in self._touched.items()],
+            )
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        while self._count > 0 and (
+            (self.max_size is not None and self._count > self.max_size)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            # Pending access times decide which row is least recently used
+            self._flush_touches()
+            blob_key, nbytes = self._conn.execute(
+                f"SELECT key, LENGTH(value) FROM {self.table} "
+                "ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            self._delete(blob_key, nbytes)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every row (statistics are kept)."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._touched.clear()
+            self._count = 0
+            self.total_bytes = 0
+
+    def close(self) -> None:
+        """Flush buffered access times and close the database connection."""
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def _table_name(function: Callable) -> str:
+    """
+    Build a valid, stable SQLite table name for a function.
+
+    The readable part comes from the qualified name; the hash of the module
+    and qualified name keeps same-named functions (and lambdas) apart.
+    """
+    identity = f"{function.__module__}.{function.__qualname__}"
+    digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:12]
+    readable = re.sub(r"\W+", "_", function.__qualname__).strip("_")[:40]
+    return f"memo_{readable}_{digest}"
+
+
+def _register(function: Callable, stats: CacheStats) -> None:
+    """Record stats under module.qualname; repeats get a " #2", " #3" suffix."""
+    name = f"{function.__module__}.{function.__qualname__}"
+    unique = name
+    count = 1
+    while unique in _registry:
+        count += 1
+        unique = f"{name} #{count}"
+    _registry[unique] = stats
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    """Build a cache key from call arguments."""
+    if not kwargs:
+        return args
+    return args + (_MISSING,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(
+    func: Optional[Callable] = None,
+    *,
+    max_size: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    sizeof: Callable[[Any], int] = sys.getsizeof,
+    path: Optional[str] = None,
+    enabled: bool = True,
+) -> Callable:
+    """
+    Memoize a function with LRU/TTL eviction and per-function statistics.
+
+    Can be used as `@memoize` or `@memoize(max_size=..., ttl=..., ...)`.
+    Arguments must be hashable (and picklable when `path` is given).
+    The wrapper exposes `.cache`, `.cache_stats()` and `.cache_clear()`.
+
+    Args:
+        func: The function to wrap (given when used without parentheses)
+        max_size: Maximum number of cached results (None for unlimited)
+        ttl: Seconds before a cached result expires (None for never)
+        max_bytes: Maximum estimated bytes of cached results
+        sizeof: Function estimating the size of a result in bytes
+        path: SQLite file for a persistent cache (default: in memory)
+        enabled: If False, return the function unchanged
+
+    Returns:
+        The memoized function, or a decorator when `func` is None
+
+    Examples:
+        >>> @memoize(max_size=2)
+        ... def square(x):
+        ...     return x * x
+        >>> square(3), square(3)
+        (9, 9)
+        >>> square.cache_stats()["hits"]
+        1
+    """
+
+    def decorator(function: Callable) -> Callable:
+        if not enabled:
+            return function
+
+        if path is not None:
+            cache = SQLiteCache(
+                path,
+                max_size=max_size,
+                ttl=ttl,
+                max_bytes=max_bytes,
+                table=_table_name(function),
+            )
+        else:
+            cache = LRUCache(
+                max_size=max_size, ttl=ttl, max_bytes=max_bytes, sizeof=sizeof
+            )
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                # Computed outside the cache lock, so concurrent misses for
+                # the same key may each call the function once
+                result = function(*args, **kwargs)
+                cache.set(key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_stats = cache.stats.to_dict
+        wrapper.cache_clear = cache.clear
+        _register(function, cache.stats)
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def _as_bool(value: Any) -> bool:
+    """Interpret a setting that may be a bool or a string such as "false"."""
+    if isinstance(value, str):
+        return value.strip().lower() not in {"0", "false", "no", "off", ""}
+    return bool(value)
+
+
+def memoize_from_config(config: Any, **kwargs) -> Callable:
+    """
+    Build a memoize decorator from `cache_enabled`/`max_cache_size` settings.
+
+    String values, as read from environment variables, are parsed:
+    "0", "false", "no", "off" and "" disable the cache.
+
+    Args:
+        config: A dict or an object with a `get(key, default)` method,
+            such as the Config class of advanced_package
+        **kwargs: Extra memoize options (ttl, max_bytes, path, ...)
+
+    Returns:
+        A decorator configured from the settings
+
+    Examples:
+        >>> settings = {"cache_enabled": True, "max_cache_size": 10}
+        >>> cached_abs = memoize_from_config(settings)(abs)
+        >>> cached_abs.cache.max_size
+        10
+    """
+    return memoize(
+        enabled=_as_bool(config.get("cache_enabled", True)),
+        max_size=int(config.get("max_cache_size", 128)),
+        **kwargs,
+    )
+
+
+def cache_report() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the statistics of every memoized function.
+
+    Returns:
+        Dictionary mapping module.qualname of each function to its counters
+    """
+    return {name: stats.to_dict() for name, stats in _registry.items()}
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    # Test the functions
+    print("Testing cache utilities...")
+
+    # Test LRU eviction and statistics
+    @memoize(max_size=2)
+    def square(x):
+        return x * x
+
+    assert square(2) == 4 and square(3) == 9 and square(2) == 4
+    square(4)  # Evicts 3, the least recently used entry
+    assert square.cache_stats()["hits"] == 1
+    assert square.cache_stats()["evictions"] == 1
+    assert len(square.cache) == 2
+
+    # Test TTL expiration
+    @memoize(ttl=0.01)
+    def now(tag):
+        return time.monotonic()
+
+    first = now("a")
+    assert now("a") == first
+    time.sleep(0.02)
+    assert now("a") != first
+    assert now.cache_stats()["expirations"] == 1
+
+    # Test byte budget
+    @memoize(max_size=None, max_bytes=200)
+    def blob(n):
+        return b"x" * n
+
+    blob(100)
+    blob(101)
+    assert blob.cache_stats()["evictions"] == 1
+    assert blob.cache.total_bytes <= 200
+    blob.cache.set(100, b"x" * 500)  # Too large: drops the old value instead
+    assert blob.cache.get(100) is None and 100 not in blob.cache._data
+
+    # Test persistence across cache instances
+    db_path = os.path.join(tempfile.mkdtemp(), "cache.db")
+    calls = []
+
+    def slow_double(x):
+        calls.append(x)
+        return x * 2
+
+    assert memoize(path=db_path)(slow_double)(21) == 42
+    assert memoize(path=db_path)(slow_double)(21) == 42
+    assert calls == [21]
+
+    # Test SQLite LRU order with buffered access times and tracked sizes
+    lru_path = os.path.join(os.path.dirname(db_path), "lru.db")
+    disk = SQLiteCache(lru_path, max_size=2, touch_batch=100)
+    disk.set("a", 1)
+    disk.set("b", 2)
+    assert disk.get("a") == 1  # Buffered, not yet written
+    disk.set("c", 3)  # Flushes access times, then evicts "b"
+    assert disk.get("b") is None and disk.get("a") == 1 and len(disk) == 2
+    disk.set("a", "x" * 100)
+    assert disk.total_bytes == len(pickle.dumps("x" * 100)) + len(pickle.dumps(3))
+    disk.close()
+    disk = SQLiteCache(lru_path, max_size=2)
+    assert len(disk) == 2 and disk.get("a") == "x" * 100
+    disk.clear()
+    assert len(disk) == 0 and disk.total_bytes == 0
+    disk.close()
+
+    # Test that same-named functions and lambdas get their own tables
+    def scaled(x):
+        return x * 2
+
+    def make_scaled():
+        def scaled(x):
+            return x * 3
+
+        return scaled
+
+    assert memoize(path=db_path)(scaled)(5) == 10
+    assert memoize(path=db_path)(make_scaled())(5) == 15
+    assert memoize(path=db_path)(lambda x: x + 1)(5) == 6
+
+    # Test thread safety
+    counter = memoize(max_size=10)(lambda x: x + 1)
+    threads = [
+        threading.Thread(target=lambda: [counter(i % 20) for i in range(1000)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(counter.cache) <= 10
+
+    # Test config-driven memoization
+    assert memoize_from_config({"cache_enabled": False})(abs) is abs
+    assert memoize_from_config({"cache_enabled": "false"})(abs) is abs
+    assert memoize_from_config({"cache_enabled": " Off "})(abs) is abs
+    assert memoize_from_config({"cache_enabled": "true"})(abs) is not abs
+
+    # Test that same-named and re-decorated functions keep separate stats
+    report = cache_report()
+    assert "__main__.scaled" in report
+    assert "__main__.make_scaled.<locals>.scaled" in report
+    assert "__main__.slow_double" in report and "__main__.slow_double #2" in report
+    assert "__main__.<lambda>" in report and "__main__.<lambda> #2" in report
+
+    print(report)
+    print("All tests passed!")
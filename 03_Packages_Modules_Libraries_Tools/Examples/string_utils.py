@@ -5,8 +5,30 @@ String Utilities Module
 A collection of useful string manipulation functions.
 """
 
+import gc
+import multiprocessing
+import random
 import re
-from typing import List, Dict, Any
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Patterns are compiled once at import time instead of looked up per call
+_NON_ALNUM = re.compile(r"[^a-zA-Z0-9]")
+_NON_DIGIT = re.compile(r"[^\d]")
+_WHITESPACE = re.compile(r"\s")
+_NUMBER = re.compile(r"\d+")
+_EMAIL = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_NON_WORD = re.compile(r"[^\w]")
+
+# The batch variants clean a whole chunk joined by a NUL separator in one
+# regex pass, so these patterns leave the separator in place
+_SEPARATOR = "\0"
+_NON_ALNUM_KEEP_SEPARATOR = re.compile(r"[^a-zA-Z0-9\0]")
+_PUNCTUATION_KEEP_SEPARATOR = re.compile(r"[^\w\s\0]")
 
 
 def reverse_string(text: str) -> str:
@@ -65,7 +87,7 @@ def is_palindrome(text: str) -> bool:
         False
     """
     # Remove non-alphanumeric characters and convert to lowercase
-    cleaned = re.sub(r"[^a-zA-Z0-9]", "", text.lower())
+    cleaned = _NON_ALNUM.sub("", text.lower())
     return cleaned == cleaned[::-1]
 
 
@@ -86,7 +108,7 @@ def format_phone_number(phone: str) -> str:
         '(123) 456-7890'
     """
     # Remove all non-digit characters
-    digits = re.sub(r"[^\d]", "", phone)
+    digits = _NON_DIGIT.sub("", phone)
 
     if len(digits) == 10:
         return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
@@ -202,8 +224,8 @@ def is_anagram(str1: str, str2: str) -> bool:
         False
     """
     # Remove spaces and convert to lowercase
-    str1_clean = re.sub(r"\s", "", str1.lower())
-    str2_clean = re.sub(r"\s", "", str2.lower())
+    str1_clean = _WHITESPACE.sub("", str1.lower())
+    str2_clean = _WHITESPACE.sub("", str2.lower())
 
     return sorted(str1_clean) == sorted(str2_clean)
 
@@ -224,7 +246,7 @@ def extract_numbers(text: str) -> List[int]:
         >>> extract_numbers("No numbers here")
         []
     """
-    numbers = re.findall(r"\d+", text)
+    numbers = _NUMBER.findall(text)
     return [int(num) for num in numbers]
 
 
@@ -244,8 +266,7 @@ def validate_email(email: str) -> bool:
         >>> validate_email("invalid-email")
         False
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL.match(email))
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -291,13 +312,303 @@ def word_frequency(text: str) -> Dict[str, int]:
 
     for word in words:
         # Remove punctuation
-        word = re.sub(r"[^\w]", "", word)
+        word = _NON_WORD.sub("", word)
         if word:
             frequency[word] = frequency.get(word, 0) + 1
 
     return frequency
 
 
+# Batch API
+# ---------
+# The *_many variants take any iterable (a list, a file, a generator) and
+# yield one result per input, in order. Input is consumed in chunks of
+# `chunk_size`, so memory stays bounded for arbitrarily long streams. With
+# `workers` > 1 the chunks are processed on a process pool.
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of up to `size` consecutive items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _joined_lower(texts: List[str]) -> Optional[str]:
+    """Lowercase a chunk as one string, or None if a text contains the separator."""
+    joined = _SEPARATOR.join(texts).lower()
+    if joined.count(_SEPARATOR) != len(texts) - 1:
+        return None
+    return joined
+
+
+def _palindrome_chunk(texts: List[str]) -> List[bool]:
+    joined = _joined_lower(texts)
+    if joined is None:
+        return [is_palindrome(text) for text in texts]
+    cleaned = _NON_ALNUM_KEEP_SEPARATOR.sub("", joined).split(_SEPARATOR)
+    return [text == text[::-1] for text in cleaned]
+
+
+def _anagram_chunk(pairs: List[Tuple[str, str]]) -> List[bool]:
+    texts = [text for pair in pairs for text in pair]
+    joined = _joined_lower(texts)
+    if joined is None:
+        return [is_anagram(str1, str2) for str1, str2 in pairs]
+    cleaned = _WHITESPACE.sub("", joined).split(_SEPARATOR)
+    return [sorted(str1) == sorted(str2) for str1, str2 in zip(*[iter(cleaned)] * 2)]
+
+
+def _numbers_chunk(texts: List[str]) -> List[List[int]]:
+    findall = _NUMBER.findall
+    return [list(map(int, findall(text))) for text in texts]
+
+
+def _email_chunk(emails: List[str]) -> List[bool]:
+    match = _EMAIL.match
+    return [match(email) is not None for email in emails]
+
+
+def _frequency_chunk(texts: List[str]) -> List[Dict[str, int]]:
+    joined = _joined_lower(texts)
+    if joined is None:
+        return [word_frequency(text) for text in texts]
+    # Dropping punctuation before splitting is equivalent to stripping it
+    # from every word afterwards, since whitespace is never removed
+    cleaned = _PUNCTUATION_KEEP_SEPARATOR.sub("", joined).split(_SEPARATOR)
+    results = []
+    for text in cleaned:
+        frequency = {}
+        for word in text.split():
+            frequency[word] = frequency.get(word, 0) + 1
+        results.append(frequency)
+    return results
+
+
+def _pool_context() -> Any:
+    """Prefer fork so workers start without re-importing the caller."""
+    sys.stdout.flush()
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _run_batched(
+    chunk_func: Callable[[List], List],
+    iterable: Iterable,
+    workers: Optional[int],
+    chunk_size: int,
+) -> Iterator:
+    """Apply chunk_func to consecutive chunks and yield the results in order."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if not workers or workers <= 1:
+        for chunk in _chunks(iterable, chunk_size):
+            yield from chunk_func(chunk)
+        return
+
+    # Executor.map would read the whole input up front; a bounded window of
+    # in-flight chunks keeps the input streaming and memory constant
+    with ProcessPoolExecutor(workers, mp_context=_pool_context()) as pool:
+        pending = deque()
+        for chunk in _chunks(iterable, chunk_size):
+            pending.append(pool.submit(chunk_func, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def is_palindrome_many(
+    texts: Iterable[str], workers: Optional[int] = None, chunk_size: int = 10_000
+) -> Iterator[bool]:
+    """
+    Check many strings for palindromes, see is_palindrome.
+
+    Args:
+        texts: Strings to check
+        workers: Number of worker processes (None or 1: run in this process)
+        chunk_size: Number of strings handled per chunk
+
+    Returns:
+        Iterator of booleans, one per input string
+
+    Examples:
+        >>> list(is_palindrome_many(["racecar", "hello", "A man, a plan"]))
+        [True, False, False]
+    """
+    return _run_batched(_palindrome_chunk, texts, workers, chunk_size)
+
+
+def is_anagram_many(
+    pairs: Iterable[Tuple[str, str]],
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+) -> Iterator[bool]:
+    """
+    Check many pairs of strings for anagrams, see is_anagram.
+
+    Args:
+        pairs: (str1, str2) tuples to compare
+        workers: Number of worker processes (None or 1: run in this process)
+        chunk_size: Number of pairs handled per chunk
+
+    Returns:
+        Iterator of booleans, one per pair
+
+    Examples:
+        >>> list(is_anagram_many([("listen", "silent"), ("hello", "world")]))
+        [True, False]
+    """
+    return _run_batched(_anagram_chunk, pairs, workers, chunk_size)
+
+
+def extract_numbers_many(
+    texts: Iterable[str], workers: Optional[int] = None, chunk_size: int = 10_000
+) -> Iterator[List[int]]:
+    """
+    Extract the numbers from many strings, see extract_numbers.
+
+    Args:
+        texts: Strings to extract numbers from
+        workers: Number of worker processes (None or 1: run in this process)
+        chunk_size: Number of strings handled per chunk
+
+    Returns:
+        Iterator of number lists, one per input string
+
+    Examples:
+        >>> list(extract_numbers_many(["5 apples and 3 oranges", "none"]))
+        [[5, 3], []]
+    """
+    return _run_batched(_numbers_chunk, texts, workers, chunk_size)
+
+
+def validate_email_many(
+    emails: Iterable[str], workers: Optional[int] = None, chunk_size: int = 10_000
+) -> Iterator[bool]:
+    """
+    Validate many email addresses, see validate_email.
+
+    Args:
+        emails: Email addresses to validate
+        workers: Number of worker processes (None or 1: run in this process)
+        chunk_size: Number of addresses handled per chunk
+
+    Returns:
+        Iterator of booleans, one per address
+
+    Examples:
+        >>> list(validate_email_many(["user@example.com", "invalid-email"]))
+        [True, False]
+    """
+    return _run_batched(_email_chunk, emails, workers, chunk_size)
+
+
+def word_frequency_many(
+    texts: Iterable[str], workers: Optional[int] = None, chunk_size: int = 10_000
+) -> Iterator[Dict[str, int]]:
+    """
+    Count word frequencies in many texts, see word_frequency.
+
+    Args:
+        texts: Texts to analyze
+        workers: Number of worker processes (None or 1: run in this process)
+        chunk_size: Number of texts handled per chunk
+
+    Returns:
+        Iterator of frequency dictionaries, one per input text
+
+    Examples:
+        >>> list(word_frequency_many(["hello world hello", "Hi, hi!"]))
+        [{'hello': 2, 'world': 1}, {'hi': 2}]
+    """
+    return _run_batched(_frequency_chunk, texts, workers, chunk_size)
+
+
+def _sample_strings(count: int, seed: int = 42) -> List[str]:
+    """Mixed palindromes, sentences, numbers and email-like strings."""
+    rng = random.Random(seed)
+    words = ["level", "hello", "world", "Python", "racecar", "data", "42", "2024"]
+    samples = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            half = "".join(rng.choice("abcde") for _ in range(rng.randint(2, 8)))
+            samples.append(half + half[::-1] if rng.random() < 0.5 else half + "x")
+        elif kind == 1:
+            samples.append(" ".join(rng.choice(words) for _ in range(6)) + ".")
+        elif kind == 2:
+            samples.append(f"order {rng.randint(1, 99999)} costs {rng.randint(1, 999)}")
+        else:
+            name = "".join(rng.choice("abcxyz.") for _ in range(7))
+            samples.append(f"{name}@example.{rng.choice(['com', 'org', 'x'])}")
+    return samples
+
+
+def benchmark_many(
+    num_strings: int = 10_000_000,
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+) -> None:
+    """
+    Time each *_many function against a loop over its scalar function.
+
+    The input is a stream of `num_strings` strings cycled from a pool of
+    distinct samples, so memory use does not grow with `num_strings`.
+
+    Args:
+        num_strings: Number of strings fed to every function
+        workers: Also time the process-pool path with this many workers (> 1)
+        chunk_size: Chunk size passed to the batch functions
+    """
+    samples = _sample_strings(1000)
+    pairs = list(zip(samples, reversed(samples)))
+    cases = [
+        ("is_palindrome", is_palindrome, is_palindrome_many, samples, False),
+        ("is_anagram", is_anagram, is_anagram_many, pairs, True),
+        ("extract_numbers", extract_numbers, extract_numbers_many, samples, False),
+        ("validate_email", validate_email, validate_email_many, samples, False),
+        ("word_frequency", word_frequency, word_frequency_many, samples, False),
+    ]
+
+    def timed(consume: Callable[[], Any]) -> float:
+        # Keep the cyclic collector from charging the batch variants for the
+        # chunk of results they hold at a time
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            consume()
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+
+    header = f"{'Function':<17}{'Scalar (s)':>12}{'Batch (s)':>12}{'Speedup':>9}"
+    if workers and workers > 1:
+        header += f"{f'Pool x{workers} (s)':>15}{'Speedup':>9}"
+    print(f"{num_strings:,} strings, chunk_size={chunk_size}")
+    print(header)
+    for name, scalar, many, pool, takes_pairs in cases:
+        stream = lambda: islice(cycle(pool), num_strings)
+        if takes_pairs:
+            scalar_time = timed(lambda: deque((scalar(a, b) for a, b in stream()), 0))
+        else:
+            scalar_time = timed(lambda: deque((scalar(s) for s in stream()), 0))
+        batch_time = timed(lambda: deque(many(stream(), None, chunk_size), 0))
+        row = (
+            f"{name:<17}{scalar_time:>12.3f}{batch_time:>12.3f}"
+            f"{scalar_time / batch_time:>8.2f}x"
+        )
+        if workers and workers > 1:
+            pool_time = timed(lambda: deque(many(stream(), workers, chunk_size), 0))
+            row += f"{pool_time:>15.3f}{scalar_time / pool_time:>8.2f}x"
+        print(row)
+
+
 if __name__ == "__main__":
     # Test the functions
     print("Testing string utilities...")
@@ -317,4 +628,29 @@ if __name__ == "__main__":
     # Test format_phone_number
     assert format_phone_number("1234567890") == "(123) 456-7890"
 
+    # Test the batch variants against the scalar functions
+    texts = _sample_strings(500) + ["A man, a plan, a canal: Panama", "", "x\0x"]
+    pairs = list(zip(texts, reversed(texts))) + [("Dormitory", "dirty room")]
+    expected = {
+        "palindrome": [is_palindrome(text) for text in texts],
+        "anagram": [is_anagram(str1, str2) for str1, str2 in pairs],
+        "numbers": [extract_numbers(text) for text in texts],
+        "email": [validate_email(text) for text in texts],
+        "frequency": [word_frequency(text) for text in texts],
+    }
+    for workers in (None, 2):
+        assert list(is_palindrome_many(texts, workers, 64)) == expected["palindrome"]
+        assert list(is_anagram_many(pairs, workers, 64)) == expected["anagram"]
+        assert list(extract_numbers_many(texts, workers, 64)) == expected["numbers"]
+        assert list(validate_email_many(texts, workers, 64)) == expected["email"]
+        assert list(word_frequency_many(texts, workers, 64)) == expected["frequency"]
+
+    # Test that the batch variants stream over iterators
+    assert next(is_palindrome_many(iter(["abba", "abc"]))) == True
+
     print("All tests passed!")
+
+    # Run with --benchmark [num_strings] to time the batch variants
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000
+        benchmark_many(count, workers=multiprocessing.cpu_count())